@@ -1,40 +1,47 @@
 """API dependencies for route protection."""
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from functools import lru_cache
 
-from app.services.auth_service import AuthService
+from fastapi import Depends, HTTPException, Request, status
 
-security = HTTPBearer()
+from app.services.auth_service import AuthService
 
 
+@lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
-    """Get AuthService instance."""
+    """Get shared AuthService instance."""
     return AuthService()
 
 
 def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    request: Request,
     auth_service: AuthService = Depends(get_auth_service)
 ) -> dict:
     """
     Dependency to get current authenticated user.
-    
+
+    Parses the Authorization header directly instead of going through
+    HTTPBearer, which allocates credential objects and runs schema checks
+    on every request.
+
     Args:
-        credentials: HTTP Bearer token credentials
+        request: Incoming request (Authorization header is read from it)
         auth_service: AuthService instance
-        
+
     Returns:
         Current user dictionary
-        
+
     Raises:
         HTTPException: If token is invalid or missing
     """
-    if not credentials:
+    auth_header = request.headers.get("authorization")
+    # The auth scheme is case-insensitive (RFC 7235), matching what
+    # HTTPBearer accepted before this was inlined.
+    scheme, _, token = (auth_header or "").partition(" ")
+    if not token or scheme.lower() != "bearer":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Not authenticated",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    user = auth_service.get_current_user(credentials.credentials)
-    return user
+
+    return auth_service.get_current_user(token.strip())
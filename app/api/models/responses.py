@@ -1,4 +1,6 @@
 """API response models."""
+import sys
+
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -104,3 +106,10 @@ class TokenResponse(BaseModel):
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
     user: UserResponse = Field(..., description="User information")
+
+
+# Intern field names of models constructed per-item on hot list endpoints so
+# keyword lookups during construction hit cached-hash pointer comparisons.
+for _model in (ClipInfo, AnalysisResult, AlertResponse, AlertHistoryResponse):
+    for _field_name in _model.model_fields:
+        sys.intern(_field_name)
@@ -1,7 +1,8 @@
 """Alerts API routes."""
 import logging
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.api.models.requests import CreateAlertRequest, UpdateAlertRequest
 from app.api.models.responses import (
@@ -11,18 +12,16 @@ from app.api.models.responses import (
     AlertHistoryListResponse
 )
 from app.api.dependencies import get_current_user
-from app.services.alert_service import AlertService
+# Same instance as the chunk pipeline: alerts/history state is in-memory,
+# so routes and pipeline must share one AlertService.
+from app.services.alert_service import get_alert_service
+from app.utils.json import ORJSONResponse, dumps
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
-def get_alert_service() -> AlertService:
-    """Get AlertService instance."""
-    return AlertService()
-
-
 @router.post("", response_model=AlertResponse, status_code=201)
 async def create_alert(
     request: CreateAlertRequest,
@@ -48,6 +47,10 @@ async def create_alert(
         )
         
         logger.info(f"Created alert: {alert['id']}")
+        # Validating constructor on purpose: response_model serialization
+        # expects created_at as a datetime, and a model_construct'd raw ISO
+        # string triggers a serializer warning per call on these single-item
+        # endpoints, where validation cost is negligible anyway.
         return AlertResponse(**alert)
         
     except Exception as e:
@@ -58,26 +61,28 @@ async def create_alert(
         ) from e
 
 
-@router.get("", response_model=AlertListResponse)
+# response_model omitted so FastAPI skips the serialize/validate pass on the
+# returned data; the schema is documented via responses= instead.
+@router.get("", responses={200: {"model": AlertListResponse}})
 async def get_all_alerts(
     current_user: dict = Depends(get_current_user)
-) -> AlertListResponse:
+) -> ORJSONResponse:
     """
     Get all alerts.
-    
+
     Returns:
         List of all alerts
-    
+
     Raises:
         HTTPException: If retrieval fails
     """
     try:
         alert_service = get_alert_service()
         alerts = alert_service.get_all_alerts()
-        
-        return AlertListResponse(
-            alerts=[AlertResponse(**alert) for alert in alerts]
-        )
+
+        # Serve the service dicts directly via orjson; skips jsonable_encoder
+        # and per-alert model validation on this list-heavy endpoint.
+        return ORJSONResponse({"alerts": alerts})
         
     except Exception as e:
         logger.error(f"Error getting alerts: {str(e)}")
@@ -130,31 +135,40 @@ async def update_alert(
         ) from e
 
 
-@router.get("/history", response_model=AlertHistoryListResponse)
+@router.get("/history", responses={200: {"model": AlertHistoryListResponse}})
 async def get_alert_history(
-    limit: int = 100,
+    # Validated up front: a bad limit must 422 here, not raise inside the
+    # streaming generator after the 200 status line has gone out.
+    limit: int = Query(100, ge=0),
     current_user: dict = Depends(get_current_user)
-) -> AlertHistoryListResponse:
+) -> StreamingResponse:
     """
     Get alert trigger history.
-    
+
     Args:
         limit: Maximum number of entries to return (default: 100)
-    
+
     Returns:
         List of alert history entries
-    
+
     Raises:
         HTTPException: If retrieval fails
     """
     try:
         alert_service = get_alert_service()
-        history = alert_service.get_alert_history(limit=limit)
-        
-        return AlertHistoryListResponse(
-            history=[AlertHistoryResponse(**entry) for entry in history]
-        )
-        
+
+        # Stream entries one at a time so large histories never build a full
+        # response body in memory before the first byte is sent.
+        def generate():
+            yield b'{"history":['
+            first = True
+            for entry in alert_service.iter_alert_history(limit=limit):
+                yield (b"" if first else b",") + dumps(entry)
+                first = False
+            yield b"]}"
+
+        return StreamingResponse(generate(), media_type="application/json")
+
     except Exception as e:
         logger.error(f"Error getting alert history: {str(e)}")
         raise HTTPException(
@@ -186,7 +200,7 @@ async def get_alert(
         
         if not alert:
             raise HTTPException(status_code=404, detail="Alert not found")
-        
+
         return AlertResponse(**alert)
         
     except HTTPException:
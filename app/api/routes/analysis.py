@@ -1,11 +1,16 @@
 """Analysis API routes."""
+import asyncio
+import functools
 import logging
+from functools import lru_cache
+from typing import Any, Dict
 
 from fastapi import APIRouter, HTTPException, Depends
 
 from app.api.models.requests import AnalysisRequest
-from app.api.models.responses import AnalysisResponse, AnalysisResult
+from app.api.models.responses import AnalysisResponse
 from app.api.dependencies import get_current_user
+from app.utils.json import ORJSONResponse
 from app.services.chroma_store import ChromaStore
 from app.services.qwen_client import QwenVLClient
 from app.services.billing_client import get_billing_client
@@ -17,8 +22,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analysis", tags=["analysis"])
 
 
+@lru_cache(maxsize=1)
 def get_chroma_store() -> ChromaStore:
-    """Get ChromaDB store instance."""
+    """Get shared ChromaDB store instance (persistent DB handle)."""
     settings = get_settings()
     return ChromaStore(
         collection_name=settings.CHROMA_COLLECTION_NAME,
@@ -26,8 +32,9 @@ def get_chroma_store() -> ChromaStore:
     )
 
 
+@lru_cache(maxsize=1)
 def get_qwen_client() -> QwenVLClient:
-    """Get Qwen API client instance."""
+    """Get shared Qwen API client instance."""
     settings = get_settings()
     return QwenVLClient(
         api_key=settings.QWEN_API_KEY,
@@ -35,11 +42,13 @@ def get_qwen_client() -> QwenVLClient:
     )
 
 
-@router.post("", response_model=AnalysisResponse)
+# response_model omitted so FastAPI skips re-validating the trusted results;
+# the schema is documented via responses= instead.
+@router.post("", responses={200: {"model": AnalysisResponse}})
 async def analyze_videos(
     request: AnalysisRequest,
     current_user: dict = Depends(get_current_user)
-) -> AnalysisResponse:
+) -> ORJSONResponse:
     """
     Analyze videos based on query using Qwen 3 VL Flash.
     
@@ -68,74 +77,82 @@ async def analyze_videos(
 
         chroma_store = get_chroma_store()
         settings = get_settings()
-        
-        # Get relevant video clips (Qwen rerank)
+
+        # Get relevant video clips (Qwen rerank). The Chroma fetch + rerank HTTP
+        # call are sync; run them in a thread so the event loop stays responsive.
         qwen_client = get_qwen_client()
-        clips = chroma_store.search_clips(
+        # Min relevance score is applied inside search_clips so low-scoring
+        # clips are never materialized here.
+        min_score = getattr(settings, "ANALYSIS_MIN_RELEVANCE_SCORE", 0.0)
+        strong_clips = await asyncio.to_thread(
+            chroma_store.search_clips,
             query=request.query,
             n_results=request.n_results or settings.DEFAULT_SEARCH_RESULTS,
             target_date=request.target_date,
             rerank_client=qwen_client,
+            min_relevance_score=min_score,
         )
-        # Filter by min relevance score before sending to VL Flash
-        min_score = getattr(settings, "ANALYSIS_MIN_RELEVANCE_SCORE", 0.0)
-        strong_clips = [c for c in clips if (c.get("relevance_score") or 0) >= min_score]
 
         if not strong_clips:
             date_desc = request.target_date.isoformat() if request.target_date else "last 24 hours"
             logger.info(
                 f"No relevant videos found for query '{request.query[:50]}...' in {date_desc} "
-                f"(candidates={len(clips)}, analysis_min_relevance_score={min_score})"
+                f"(analysis_min_relevance_score={min_score})"
             )
-            return AnalysisResponse(results=[], query=request.query)
+            return ORJSONResponse({"results": [], "query": request.query})
 
-        # Process each video sequentially with Qwen 3 VL Flash
-        results = []
-        
-        for clip in strong_clips:
+        # Analyze all clips concurrently with Qwen 3 VL Flash (network-bound),
+        # bounded by a semaphore to respect API rate limits.
+        semaphore = asyncio.Semaphore(settings.QWEN_MAX_CONCURRENCY)
+        loop = asyncio.get_running_loop()
+
+        # Each task builds a plain dict (shaped like AnalysisResult); the whole
+        # batch is rendered once at the end instead of per-item model wrapping.
+        async def _analyze_one(clip: Dict[str, Any]) -> Dict[str, Any]:
             video_url = clip["video_url"]
             local_path = clip.get("metadata", {}).get("local_path")
             try:
                 logger.info(f"Analyzing video: {video_url}")
-                analysis_output = qwen_client.analyze_video_flash(
-                    video_url=video_url,
-                    user_query=request.query,
-                    fps=settings.VIDEO_FPS
-                )
-                
-                results.append(
-                    AnalysisResult(
-                        video_url=video_url,
-                        local_path=local_path,
-                        analysis=analysis_output,
-                        error=None
+                async with semaphore:
+                    analysis_output = await loop.run_in_executor(
+                        None,
+                        functools.partial(
+                            qwen_client.analyze_video_flash,
+                            video_url=video_url,
+                            user_query=request.query,
+                            fps=settings.VIDEO_FPS
+                        )
                     )
-                )
+
                 logger.info(f"Analysis complete for: {video_url}")
-                
+                return {
+                    "video_url": video_url,
+                    "local_path": local_path,
+                    "analysis": analysis_output,
+                    "error": None
+                }
+
             except QwenAPIError as e:
                 logger.error(f"Qwen API error for {video_url}: {str(e)}")
-                results.append(
-                    AnalysisResult(
-                        video_url=video_url,
-                        local_path=local_path,
-                        analysis=None,
-                        error=str(e)
-                    )
-                )
+                return {
+                    "video_url": video_url,
+                    "local_path": local_path,
+                    "analysis": None,
+                    "error": str(e)
+                }
             except Exception as e:
                 logger.error(f"Unexpected error analyzing {video_url}: {str(e)}", exc_info=True)
-                results.append(
-                    AnalysisResult(
-                        video_url=video_url,
-                        local_path=local_path,
-                        analysis=None,
-                        error=f"Unexpected error: {str(e)}"
-                    )
-                )
-        
+                return {
+                    "video_url": video_url,
+                    "local_path": local_path,
+                    "analysis": None,
+                    "error": f"Unexpected error: {str(e)}"
+                }
+
+        results = list(await asyncio.gather(*[_analyze_one(clip) for clip in strong_clips]))
+
         logger.info(f"Completed analysis for {len(results)} videos")
-        return AnalysisResponse(results=results, query=request.query)
+        return ORJSONResponse({"results": results, "query": request.query})
         
     except ChromaDBError as e:
         logger.error(f"ChromaDB error during analysis: {str(e)}")
@@ -1,5 +1,7 @@
 """Authentication API routes."""
+import asyncio
 import logging
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -16,13 +18,15 @@ router = APIRouter(prefix="/auth", tags=["authentication"])
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
-    """Get AuthService instance."""
+    """Get shared AuthService instance."""
     return AuthService()
 
 
+@lru_cache(maxsize=1)
 def get_user_service() -> UserService:
-    """Get UserService instance."""
+    """Get shared UserService instance."""
     return UserService()
 
 
@@ -45,9 +49,10 @@ async def register(
         HTTPException: If registration fails
     """
     try:
-        # Create user
-        user_service = UserService()
-        user = user_service.create_user(
+        # Create user (bcrypt hashing is CPU-heavy; keep it off the event loop)
+        user_service = get_user_service()
+        user = await asyncio.to_thread(
+            user_service.create_user,
             email=request.email,
             password=request.password
         )
@@ -113,7 +118,10 @@ async def login(
     Raises:
         HTTPException: If login fails
     """
-    user = auth_service.authenticate_user(
+    # bcrypt verification takes ~100ms of pure CPU; run it in a worker thread
+    # so concurrent requests aren't stalled behind each login.
+    user = await asyncio.to_thread(
+        auth_service.authenticate_user,
         email=request.email,
         password=request.password
     )
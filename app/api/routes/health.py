@@ -1,21 +1,23 @@
 """Health check routes."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.api.models.responses import HealthResponse
+from app.utils.json import dumps
 from app import __version__
 
 router = APIRouter(tags=["health"])
 
+# The payload never changes after import; serialize it once and reuse the bytes
+# for every probe instead of building a model + encoding per call.
+_HEALTH_BODY = dumps({"status": "healthy", "version": __version__})
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
     """
     Health check endpoint.
-    
+
     Returns:
         Health status response
     """
-    return HealthResponse(
-        status="healthy",
-        version=__version__
-    )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -8,6 +8,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
@@ -48,8 +49,7 @@ def _get_video_duration(path: Path) -> float:
             capture_output=True, text=True, timeout=5,
         )
         if result.returncode == 0:
-            import json
-            info = json.loads(result.stdout)
+            info = orjson.loads(result.stdout)
             return float(info.get("format", {}).get("duration", 0))
     except Exception:
         pass
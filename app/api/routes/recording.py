@@ -1,10 +1,14 @@
 """Recording API routes."""
+import asyncio
 import logging
 import os
+import re
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 
 from app.api.models.requests import StartRecordingRequest
 from app.api.models.responses import RecordingResponse, StatusResponse
@@ -15,14 +19,19 @@ from app.services.chroma_store import ChromaStore
 from app.services.device_config_service import get_device_config, get_active_multi_cameras
 from app.core.config import get_settings
 from app.utils.exceptions import VideoRecordingError, ChromaDBError
+from app.utils.json import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/recording", tags=["recording"])
 
-# Global recorder instance (in production, use dependency injection)
+# Global recorder instance (in production, use dependency injection).
+# The module global stays (startup_orchestrator and main.py's shutdown hook
+# reach it outside any request), but route-level state transitions are
+# serialized so two concurrent /start calls can't both open the RTSP pull.
 _video_recorder: Optional[object] = None
 _raw_recording_active: bool = False
+_recorder_lock = asyncio.Lock()
 
 
 def get_video_recorder() -> Optional[object]:
@@ -30,6 +39,40 @@ def get_video_recorder() -> Optional[object]:
     return _video_recorder
 
 
+@lru_cache(maxsize=1)
+def _video_ext_pattern() -> "re.Pattern[str]":
+    """Compiled case-insensitive match for video file extensions.
+
+    A single regex probe runs in C and avoids the per-filename
+    str.lower() allocation of a set/tuple membership test.
+    """
+    exts = "|".join(re.escape(ext[1:]) for ext in get_settings().VIDEO_EXTENSIONS)
+    return re.compile(rf"\.(?:{exts})$", re.IGNORECASE)
+
+
+def _chroma_has_data(persist_directory: str) -> bool:
+    """Cheaply check whether the ChromaDB store holds any embeddings.
+
+    Opens Chroma's backing SQLite file read-only instead of constructing a
+    PersistentClient (which loads the HNSW index). Any doubt — missing
+    file, schema change, locked DB — reports True so the full clear path
+    still runs.
+    """
+    db_path = Path(persist_directory) / "chroma.sqlite3"
+    if not db_path.exists():
+        return False
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            conn.execute("PRAGMA query_only=1")
+            row = conn.execute("SELECT EXISTS(SELECT 1 FROM embeddings)").fetchone()
+            return bool(row and row[0])
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return True
+
+
 @router.post("/start", response_model=RecordingResponse)
 async def start_recording(
     request: StartRecordingRequest,
@@ -48,94 +91,95 @@ async def start_recording(
         HTTPException: If recording fails to start
     """
     global _video_recorder, _raw_recording_active
+
+    async with _recorder_lock:
+        if _video_recorder and _video_recorder.is_recording:
+            raise HTTPException(
+                status_code=400,
+                detail="Recording already in progress"
+            )
     
-    if _video_recorder and _video_recorder.is_recording:
-        raise HTTPException(
-            status_code=400,
-            detail="Recording already in progress"
-        )
-    
-    try:
-        settings = get_settings()
-        raw_mode = request.raw_mode or False
-        device_cfg = get_device_config() or {}
-        camera_mode = str(device_cfg.get("camera_mode") or "single").strip().lower()
-
-        if raw_mode:
-            # Raw recording: 1‑min continuous chunks, saved in footage dir.
-            # These chunks are later concatenated into 1‑hour (or partial) files.
-            # Upload to R2 after each save only when raw_auto_upload (reliable internet) is True.
-            output_dir = settings.RAW_FOOTAGE_DIR
-            chunk_duration_seconds = 60  # 1 minute per chunk
-            motion_detection_enabled = False  # motion-based recording disabled
-            motion_threshold = request.motion_threshold or 0.3
-            from app.main import raw_chunk_callback, set_raw_auto_upload
-            set_raw_auto_upload(request.raw_auto_upload if request.raw_auto_upload is not None else True)
-            callback = raw_chunk_callback
-            _raw_recording_active = True
-            if camera_mode == "multi":
-                active_cameras = get_active_multi_cameras(device_cfg)
-                if not active_cameras:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Multi-camera mode is enabled but no active camera RTSP links are configured.",
+        try:
+            settings = get_settings()
+            raw_mode = request.raw_mode or False
+            device_cfg = get_device_config() or {}
+            camera_mode = str(device_cfg.get("camera_mode") or "single").strip().lower()
+
+            if raw_mode:
+                # Raw recording: 1‑min continuous chunks, saved in footage dir.
+                # These chunks are later concatenated into 1‑hour (or partial) files.
+                # Upload to R2 after each save only when raw_auto_upload (reliable internet) is True.
+                output_dir = settings.RAW_FOOTAGE_DIR
+                chunk_duration_seconds = 60  # 1 minute per chunk
+                motion_detection_enabled = False  # motion-based recording disabled
+                motion_threshold = request.motion_threshold or 0.3
+                from app.main import raw_chunk_callback, set_raw_auto_upload
+                set_raw_auto_upload(request.raw_auto_upload if request.raw_auto_upload is not None else True)
+                callback = raw_chunk_callback
+                _raw_recording_active = True
+                if camera_mode == "multi":
+                    active_cameras = get_active_multi_cameras(device_cfg)
+                    if not active_cameras:
+                        raise HTTPException(
+                            status_code=400,
+                            detail="Multi-camera mode is enabled but no active camera RTSP links are configured.",
+                        )
+                    _video_recorder = MultiCameraGridRecorder(
+                        cameras=device_cfg.get("multi_cameras_json", []),
+                        output_dir=output_dir,
+                        chunk_duration=chunk_duration_seconds,
                     )
-                _video_recorder = MultiCameraGridRecorder(
-                    cameras=device_cfg.get("multi_cameras_json", []),
-                    output_dir=output_dir,
-                    chunk_duration=chunk_duration_seconds,
-                )
-                _video_recorder.start_recording(callback=callback)
-                from app.services.device_config_service import set_recording_active
-                set_recording_active(True)
-                logger.info("Recording started for multi-camera grid (%d active cameras)", len(active_cameras))
-                return RecordingResponse(status="recording_started", rtsp_url="multi-camera-grid")
-        else:
-            output_dir = settings.RECORDINGS_DIR
-            if not (request.rtsp_url or "").strip():
-                raise HTTPException(status_code=400, detail="RTSP URL is required for single-camera recording.")
-            if request.chunk_duration:
-                chunk_duration_seconds = request.chunk_duration * 60
+                    _video_recorder.start_recording(callback=callback)
+                    from app.services.device_config_service import set_recording_active
+                    set_recording_active(True)
+                    logger.info("Recording started for multi-camera grid (%d active cameras)", len(active_cameras))
+                    return RecordingResponse(status="recording_started", rtsp_url="multi-camera-grid")
             else:
-                chunk_duration_seconds = settings.VIDEO_CHUNK_DURATION
-            # Motion-based recording is disabled; always run continuous FFmpeg segmenter.
-            motion_detection_enabled = False
-            motion_threshold = request.motion_threshold or 0.3
-            from app.main import chunk_callback
-            callback = chunk_callback
-            _raw_recording_active = False
+                output_dir = settings.RECORDINGS_DIR
+                if not (request.rtsp_url or "").strip():
+                    raise HTTPException(status_code=400, detail="RTSP URL is required for single-camera recording.")
+                if request.chunk_duration:
+                    chunk_duration_seconds = request.chunk_duration * 60
+                else:
+                    chunk_duration_seconds = settings.VIDEO_CHUNK_DURATION
+                # Motion-based recording is disabled; always run continuous FFmpeg segmenter.
+                motion_detection_enabled = False
+                motion_threshold = request.motion_threshold or 0.3
+                from app.main import chunk_callback
+                callback = chunk_callback
+                _raw_recording_active = False
 
-        _video_recorder = VideoRecorder(
-            rtsp_url=request.rtsp_url,
-            output_dir=output_dir,
-            chunk_duration=chunk_duration_seconds,
-            motion_detection_enabled=motion_detection_enabled,
-            motion_threshold=motion_threshold
-        )
+            _video_recorder = VideoRecorder(
+                rtsp_url=request.rtsp_url,
+                output_dir=output_dir,
+                chunk_duration=chunk_duration_seconds,
+                motion_detection_enabled=motion_detection_enabled,
+                motion_threshold=motion_threshold
+            )
         
-        _video_recorder.start_recording(callback=callback)
+            _video_recorder.start_recording(callback=callback)
 
-        if raw_mode:
-            from app.services.device_config_service import set_recording_active
-            set_recording_active(True)
+            if raw_mode:
+                from app.services.device_config_service import set_recording_active
+                set_recording_active(True)
 
-        logger.info(f"Recording started for {request.rtsp_url}" + (" (raw footage)" if raw_mode else ""))
-        return RecordingResponse(
-            status="recording_started",
-            rtsp_url=request.rtsp_url
-        )
-    except VideoRecordingError as e:
-        logger.error(f"Failed to start recording: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to start recording: {str(e)}"
-        ) from e
-    except Exception as e:
-        logger.error(f"Unexpected error starting recording: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Unexpected error: {str(e)}"
-        ) from e
+            logger.info(f"Recording started for {request.rtsp_url}" + (" (raw footage)" if raw_mode else ""))
+            return RecordingResponse(
+                status="recording_started",
+                rtsp_url=request.rtsp_url
+            )
+        except VideoRecordingError as e:
+            logger.error(f"Failed to start recording: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to start recording: {str(e)}"
+            ) from e
+        except Exception as e:
+            logger.error(f"Unexpected error starting recording: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unexpected error: {str(e)}"
+            ) from e
 
 
 @router.post("/stop", response_model=RecordingResponse)
@@ -151,53 +195,64 @@ async def stop_recording(
     Raises:
         HTTPException: If no recording is in progress
     """
-    global _video_recorder
-    
-    if not _video_recorder or not _video_recorder.is_recording:
-        raise HTTPException(
-            status_code=400,
-            detail="No recording in progress"
-        )
-    
-    try:
-        global _raw_recording_active
-        rtsp_url = _video_recorder.rtsp_url
-        was_raw = _raw_recording_active
-        _video_recorder.stop_recording()
-        _raw_recording_active = False
-        if was_raw:
-            from app.main import flush_raw_segments
-            flush_raw_segments()
-        from app.services.device_config_service import set_recording_active
-        set_recording_active(False)
-        logger.info("Recording stopped")
-        return RecordingResponse(
-            status="recording_stopped",
-            rtsp_url=rtsp_url
-        )
-    except Exception as e:
-        logger.error(f"Failed to stop recording: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to stop recording: {str(e)}"
-        ) from e
+    global _video_recorder, _raw_recording_active
 
+    async with _recorder_lock:
+        if not _video_recorder or not _video_recorder.is_recording:
+            raise HTTPException(
+                status_code=400,
+                detail="No recording in progress"
+            )
 
-@router.get("/status", response_model=StatusResponse)
+        try:
+            rtsp_url = _video_recorder.rtsp_url
+            was_raw = _raw_recording_active
+            _video_recorder.stop_recording()
+            _raw_recording_active = False
+            if was_raw:
+                from app.main import flush_raw_segments
+                flush_raw_segments()
+            from app.services.device_config_service import set_recording_active
+            set_recording_active(False)
+            logger.info("Recording stopped")
+            return RecordingResponse(
+                status="recording_stopped",
+                rtsp_url=rtsp_url
+            )
+        except Exception as e:
+            logger.error(f"Failed to stop recording: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to stop recording: {str(e)}"
+            ) from e
+
+
+@router.get("/status", responses={200: {"model": StatusResponse}})
 async def get_status(
+    request: Request,
     current_user: dict = Depends(get_current_user)
-) -> StatusResponse:
+) -> Response:
     """
     Get current recording status.
-    
+
+    The mobile UI polls this endpoint; an ETag derived from the current
+    state lets unchanged polls short-circuit with 304 Not Modified.
+
     Returns:
         Status response with recording state
     """
     global _video_recorder
-    
-    return StatusResponse(
-        recording=bool(_video_recorder.is_recording) if _video_recorder else False,
-        rtsp_url=getattr(_video_recorder, "rtsp_url", None) if _video_recorder else None
+
+    recording = bool(_video_recorder.is_recording) if _video_recorder else False
+    rtsp_url = getattr(_video_recorder, "rtsp_url", None) if _video_recorder else None
+
+    etag = f'W/"{int(recording)}-{rtsp_url or ""}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    return ORJSONResponse(
+        {"recording": recording, "rtsp_url": rtsp_url},
+        headers={"ETag": etag}
     )
 
 
@@ -221,14 +276,19 @@ async def clear_database(
     try:
         settings = get_settings()
         
-        # Clear ChromaDB
+        # Clear ChromaDB. Skip the client construction (SQLite open + HNSW
+        # index load) entirely when the store holds nothing to clear.
         try:
-            chroma_store = ChromaStore(
-                collection_name=settings.CHROMA_COLLECTION_NAME,
-                persist_directory=settings.CHROMA_DB_DIR
-            )
-            chroma_store.clear_all()
-            logger.info("ChromaDB cleared successfully")
+            if _chroma_has_data(settings.CHROMA_DB_DIR):
+                chroma_store = ChromaStore(
+                    collection_name=settings.CHROMA_COLLECTION_NAME,
+                    persist_directory=settings.CHROMA_DB_DIR
+                )
+                # Batched deletes can take a while; run off the event loop
+                await asyncio.to_thread(chroma_store.clear_all)
+                logger.info("ChromaDB cleared successfully")
+            else:
+                logger.info("ChromaDB already empty, skipping clear")
         except ChromaDBError as e:
             logger.error(f"Failed to clear ChromaDB: {str(e)}")
             raise HTTPException(
@@ -236,19 +296,36 @@ async def clear_database(
                 detail=f"Failed to clear ChromaDB: {str(e)}"
             ) from e
         
-        # Delete all video files from recordings directory
+        # Delete all video files from recordings directory. scandir avoids a
+        # stat per entry, and unlinks run concurrently in worker threads so a
+        # multi-thousand-file sweep doesn't stall the event loop.
         recordings_dir = Path(settings.RECORDINGS_DIR)
         deleted_count = 0
         if recordings_dir.exists():
-            video_extensions = {'.avi', '.mp4', '.mov', '.mkv', '.webm'}
-            for video_file in recordings_dir.iterdir():
-                if video_file.is_file() and video_file.suffix.lower() in video_extensions:
-                    try:
-                        video_file.unlink()
-                        deleted_count += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to delete {video_file}: {str(e)}")
-            
+            is_video = _video_ext_pattern().search
+            with os.scandir(recordings_dir) as entries:
+                targets = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False) and is_video(entry.name)
+                ]
+
+            semaphore = asyncio.Semaphore(32)
+
+            async def _remove(path: str):
+                async with semaphore:
+                    await asyncio.to_thread(os.unlink, path)
+
+            results = await asyncio.gather(
+                *(_remove(path) for path in targets),
+                return_exceptions=True
+            )
+            for path, result in zip(targets, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to delete {path}: {str(result)}")
+                else:
+                    deleted_count += 1
+
             logger.info(f"Deleted {deleted_count} video files from recordings directory")
         else:
             logger.info("Recordings directory does not exist, skipping file deletion")
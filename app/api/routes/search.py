@@ -1,5 +1,7 @@
 """Search API routes."""
+import asyncio
 import logging
+from functools import lru_cache
 
 from fastapi import APIRouter, HTTPException, Depends
 
@@ -16,8 +18,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/search", tags=["search"])
 
 
+@lru_cache(maxsize=1)
 def get_chroma_store() -> ChromaStore:
-    """Get ChromaDB store instance."""
+    """Get shared ChromaDB store instance (persistent DB handle)."""
     settings = get_settings()
     return ChromaStore(
         collection_name=settings.CHROMA_COLLECTION_NAME,
@@ -25,15 +28,17 @@ def get_chroma_store() -> ChromaStore:
     )
 
 
+@lru_cache(maxsize=1)
 def get_qwen_client() -> QwenVLClient:
-    """Get Qwen API client (for embedding/rerank and VL)."""
+    """Get shared Qwen API client (for embedding/rerank and VL)."""
     settings = get_settings()
     return QwenVLClient(api_key=settings.QWEN_API_KEY, base_url=settings.QWEN_BASE_URL)
 
 
 @router.get("/stats", response_model=ProcessingStatsResponse)
 async def get_processing_stats(
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    chroma_store: ChromaStore = Depends(get_chroma_store)
 ) -> ProcessingStatsResponse:
     """
     Get processing statistics for the last 24 hours.
@@ -45,10 +50,12 @@ async def get_processing_stats(
         HTTPException: If retrieval fails
     """
     try:
-        chroma_store = get_chroma_store()
-        stats = chroma_store.get_processing_stats()
+        # One cached metadata scan serves both dashboard endpoints;
+        # blocking SQLite work stays off the event loop
+        snapshot = await asyncio.to_thread(chroma_store.get_dashboard_snapshot)
+        stats = snapshot["stats"]
         
-        logger.info(f"Processing stats: {stats['chunks_processed']} chunks processed")
+        logger.info("Processing stats: %d chunks processed", stats['chunks_processed'])
         return ProcessingStatsResponse(**stats)
         
     except ChromaDBError as e:
@@ -67,7 +74,8 @@ async def get_processing_stats(
 
 @router.get("/available-dates", response_model=AvailableDatesResponse)
 async def get_available_dates(
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    chroma_store: ChromaStore = Depends(get_chroma_store)
 ) -> AvailableDatesResponse:
     """
     Get list of dates that have stored video entries.
@@ -79,10 +87,11 @@ async def get_available_dates(
         HTTPException: If retrieval fails
     """
     try:
-        chroma_store = get_chroma_store()
-        dates = chroma_store.get_available_dates()
+        # Shares the cached snapshot scan with /processing-stats
+        snapshot = await asyncio.to_thread(chroma_store.get_dashboard_snapshot)
+        dates = snapshot["dates"]
         
-        logger.info(f"Retrieved {len(dates)} available dates")
+        logger.info("Retrieved %d available dates", len(dates))
         return AvailableDatesResponse(dates=dates)
         
     except ChromaDBError as e:
@@ -99,10 +108,38 @@ async def get_available_dates(
         ) from e
 
 
+# Identical searches issued while one is already running (e.g. a double-tapped
+# mobile query) share the in-flight result instead of paying a second Chroma
+# fetch + rerank call. The rerank API takes a single query per request, so
+# cross-query batching isn't possible; coalescing duplicates is the next best.
+_inflight_searches: dict = {}
+
+
+async def _search_clips_coalesced(chroma_store, qwen_client, query, n_results, target_date):
+    """Run search_clips in a thread, sharing results between identical concurrent calls."""
+    key = (query, n_results, target_date)
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.create_task(
+            asyncio.to_thread(
+                chroma_store.search_clips,
+                query=query,
+                n_results=n_results,
+                target_date=target_date,
+                rerank_client=qwen_client,
+            )
+        )
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda _t, _k=key: _inflight_searches.pop(_k, None))
+    return await asyncio.shield(task)
+
+
 @router.post("/clips", response_model=ClipSearchResponse)
 async def search_clips(
     request: QueryRequest,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    chroma_store: ChromaStore = Depends(get_chroma_store),
+    qwen_client: QwenVLClient = Depends(get_qwen_client)
 ) -> ClipSearchResponse:
     """
     Search for relevant video clips based on query.
@@ -120,13 +157,15 @@ async def search_clips(
         HTTPException: If search fails
     """
     try:
-        chroma_store = get_chroma_store()
-        qwen_client = get_qwen_client()
-        clips_data = chroma_store.search_clips(
+        settings = get_settings()
+        # Sync Chroma fetch + rerank HTTP call; run off the event loop and
+        # share the result with identical concurrent queries.
+        clips_data = await _search_clips_coalesced(
+            chroma_store,
+            qwen_client,
             query=request.query,
-            n_results=request.n_results or get_settings().DEFAULT_SEARCH_RESULTS,
+            n_results=request.n_results or settings.DEFAULT_SEARCH_RESULTS,
             target_date=request.target_date,
-            rerank_client=qwen_client,
         )
         clips = [
             ClipInfo(
@@ -137,8 +176,12 @@ async def search_clips(
             for clip in clips_data
         ]
         
-        date_desc = request.target_date.isoformat() if request.target_date else "last 24 hours"
-        logger.info(f"Found {len(clips)} clips for query '{request.query[:50]}...' in {date_desc}")
+        # %-style args are only formatted if the record is emitted, so the
+        # slice/str() work is skipped when INFO is filtered out.
+        logger.info(
+            "Found %d clips for query '%.50s...' in %s",
+            len(clips), request.query, request.target_date or "last 24 hours"
+        )
         return ClipSearchResponse(clips=clips, query=request.query)
         
     except ChromaDBError as e:
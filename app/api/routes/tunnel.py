@@ -1,10 +1,11 @@
 """Tunnel management routes."""
 import logging
 from typing import Callable
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 
 from app.api.dependencies import get_current_user
 from app.utils.exceptions import VideoRecordingError
+from app.utils.json import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +23,18 @@ def set_tunnel_manager_getter(getter: Callable):
 
 @router.get("/url")
 async def get_tunnel_url(
+    request: Request,
     current_user: dict = Depends(get_current_user)
-) -> dict:
+) -> Response:
     """
     Get the current Cloudflare tunnel URL for mobile pairing.
-    
+
+    The pairing screen polls this endpoint; an ETag derived from the URL
+    lets unchanged polls short-circuit with 304 Not Modified.
+
     Returns:
         Dictionary with tunnel_url (or null if not available)
-    
+
     Raises:
         HTTPException: If tunnel is not available
     """
@@ -54,8 +59,14 @@ async def get_tunnel_url(
                     detail=f"Tunnel not available: {str(e)}"
                 ) from e
         
-        return {"tunnel_url": tunnel_url}
-        
+        etag = f'W/"{tunnel_url or ""}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+
+        return ORJSONResponse({"tunnel_url": tunnel_url}, headers={"ETag": etag})
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting tunnel URL: {str(e)}")
         raise HTTPException(
@@ -1,17 +1,119 @@
 """Video serving API routes."""
+import hashlib
 import logging
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
+from app.api.dependencies import get_auth_service
 from app.core.config import get_settings
-from app.services.auth_service import AuthService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/videos", tags=["videos"])
 
+# Read size per chunk when streaming video bodies.
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Files above this size never stream in full without a Range header; the
+# response is capped to an initial 206 window so HTML5 players switch to
+# Range-driven playback instead of occupying a threadpool worker for the
+# whole recording.
+_LARGE_FILE_THRESHOLD = 32 * 1024 * 1024
+_INITIAL_RANGE_WINDOW = 2 * 1024 * 1024
+
+# A playback session issues dozens of Range requests with the same token;
+# cache verified payloads briefly (bounded LRU, TTL capped by token expiry)
+# so scrubbing doesn't re-run signature verification per request.
+_TOKEN_CACHE_MAX_ENTRIES = 1024
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_token_cache: "OrderedDict[bytes, Tuple[float, Dict]]" = OrderedDict()
+
+
+def _verify_token_cached(token: str) -> Dict:
+    """Verify a JWT, serving repeat hits from a short-lived LRU cache."""
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    now = time.monotonic()
+
+    entry = _token_cache.get(key)
+    if entry and entry[0] > now:
+        _token_cache.move_to_end(key)
+        return entry[1]
+
+    payload = get_auth_service().verify_token(token)
+
+    ttl = _TOKEN_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, max(exp - time.time(), 0.0))
+    if ttl > 0:
+        _token_cache[key] = (now + ttl, payload)
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > _TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.popitem(last=False)
+
+    return payload
+
+
+@lru_cache(maxsize=512)
+def _media_headers(filename: str, suffix: str) -> Tuple[str, str]:
+    """Resolve (media_type, Content-Disposition) for a clip name once.
+
+    A playback session issues hundreds of Range requests for the same
+    file; memoizing skips the lookup and f-string on every one.
+    """
+    media_type = get_settings().VIDEO_CONTENT_TYPES.get(suffix, "video/mp4")
+    return media_type, f'inline; filename="{filename}"'
+
+
+def _parse_range(range_header: str, file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single "bytes=start-end" Range header.
+
+    Returns:
+        (start, end) byte offsets (inclusive), or None if the header is
+        malformed or unsatisfiable.
+    """
+    try:
+        units, _, spec = range_header.partition("=")
+        if units.strip().lower() != "bytes" or "," in spec:
+            return None
+        start_str, _, end_str = spec.strip().partition("-")
+        if start_str:
+            start = int(start_str)
+            end = int(end_str) if end_str else file_size - 1
+        elif end_str:
+            # Suffix range: last N bytes
+            start = max(file_size - int(end_str), 0)
+            end = file_size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+
+    if start > end or start >= file_size:
+        return None
+    return start, min(end, file_size - 1)
+
+
+def _iter_file(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield the byte range [start, end] of a file in fixed-size chunks."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            data = f.read(min(_STREAM_CHUNK_SIZE, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            yield data
+
 
 @router.get("/{file_path:path}")
 async def get_video(
@@ -45,45 +147,84 @@ async def get_video(
         raise HTTPException(status_code=401, detail="Missing authentication token")
 
     # Validate token (we don't need the user payload for streaming)
-    AuthService().verify_token(raw_token)
+    _verify_token_cached(raw_token)
 
     settings = get_settings()
-    recordings_dir = Path(settings.RECORDINGS_DIR)
-    video_path = recordings_dir / file_path
-    
-    # Security: Ensure the file is within the recordings directory (prevent path traversal)
-    try:
-        video_path.resolve().relative_to(recordings_dir.resolve())
-    except ValueError:
+    recordings_root = str(settings.RECORDINGS_PATH)
+
+    # Security: Ensure the file is within the recordings directory (prevent
+    # path traversal). RECORDINGS_PATH is resolved once at startup, so one
+    # realpath on the requested file plus a prefix check is enough.
+    full_path = os.path.realpath(os.path.join(recordings_root, file_path))
+    if not full_path.startswith(recordings_root + os.sep):
         raise HTTPException(
             status_code=403,
             detail="Access denied: Invalid file path"
         )
-    
-    if not video_path.exists():
-        logger.warning(f"Video file not found: {file_path}")
+
+    # Single stat covers both the existence check and the size for ranges.
+    try:
+        file_size = os.stat(full_path).st_size
+    except OSError:
+        logger.warning("Video file not found: %s", file_path)
         raise HTTPException(
             status_code=404,
             detail=f"Video file not found: {file_path}"
         )
-    
+
+    video_path = Path(full_path)
+
     # Determine content type based on file extension
-    ext = video_path.suffix.lower()
-    content_types = {
-        '.avi': 'video/x-msvideo',
-        '.mp4': 'video/mp4',
-        '.mov': 'video/quicktime',
-        '.mkv': 'video/x-matroska',
-        '.webm': 'video/webm',
+    media_type, content_disposition = _media_headers(
+        video_path.name, video_path.suffix.lower()
+    )
+
+    # Honor Range requests so <video> seeks fetch only the requested bytes
+    # instead of re-downloading whole recordings; bodies stream in chunks
+    # (sync generator -> Starlette threadpool) without blocking the loop.
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": content_disposition
     }
-    media_type = content_types.get(ext, 'video/mp4')
-    
-    logger.debug(f"Serving video: {file_path}")
-    return FileResponse(
-        video_path,
+
+    range_header = request.headers.get("range")
+    if range_header:
+        byte_range = _parse_range(range_header, file_size)
+        if byte_range is None:
+            raise HTTPException(
+                status_code=416,
+                detail="Requested range not satisfiable",
+                headers={"Content-Range": f"bytes */{file_size}"}
+            )
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+        headers["Content-Length"] = str(end - start + 1)
+        logger.debug("Serving video range %d-%d: %s", start, end, file_path)
+        return StreamingResponse(
+            _iter_file(video_path, start, end),
+            status_code=206,
+            media_type=media_type,
+            headers=headers
+        )
+
+    if file_size > _LARGE_FILE_THRESHOLD:
+        # Serve only the first window; the Content-Range tells the player
+        # the full size so it resumes with explicit Range requests.
+        end = _INITIAL_RANGE_WINDOW - 1
+        headers["Content-Range"] = f"bytes 0-{end}/{file_size}"
+        headers["Content-Length"] = str(end + 1)
+        logger.debug("Serving initial window of large video: %s", file_path)
+        return StreamingResponse(
+            _iter_file(video_path, 0, end),
+            status_code=206,
+            media_type=media_type,
+            headers=headers
+        )
+
+    headers["Content-Length"] = str(file_size)
+    logger.debug("Serving video: %s", file_path)
+    return StreamingResponse(
+        _iter_file(video_path, 0, file_size - 1),
         media_type=media_type,
-        headers={
-            "Accept-Ranges": "bytes",
-            "Content-Disposition": f'inline; filename="{video_path.name}"'
-        }
+        headers=headers
     )
@@ -1,9 +1,9 @@
 """Application configuration management."""
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, FrozenSet, Optional
 from pydantic_settings import BaseSettings
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 
 class Settings(BaseSettings):
@@ -25,6 +25,10 @@ class Settings(BaseSettings):
     QWEN_RERANK_MAX_DOCS: int = 500
     # Max chars per document for reranker (truncate; ~4k tokens ≈ 16k chars)
     QWEN_RERANK_MAX_CHARS_PER_DOC: int = 16000
+    # Ask the reranker for this many times n_results so the relevance-score
+    # floor can discard some without under-filling (remote call; oversizing
+    # costs tokens)
+    QWEN_RERANK_OVERFETCH: float = 1.5
 
     # Cloudflare R2 Settings
     R2_ACCOUNT_ID: str = ""
@@ -47,12 +51,28 @@ class Settings(BaseSettings):
     )
     VIDEO_CHUNK_DURATION: int = 600  # 10 minutes in seconds
     VIDEO_FPS: int = 2
+    # Worker threads for the completed-chunk pipeline: upload stage is
+    # disk/network I/O, analyze stage mostly waits on the Qwen API
+    CHUNK_WORKERS: int = 4
+    CHUNK_ANALYZE_WORKERS: int = 8
+    # Backpressure: max chunks queued or in flight, and how long a new chunk
+    # waits for a slot before being dropped (recorder keeps the file on disk)
+    CHUNK_QUEUE_MAX: int = 16
+    CHUNK_QUEUE_TIMEOUT: float = 30.0
     
     # Storage Settings
     RECORDINGS_DIR: str = "recordings"
     RAW_FOOTAGE_DIR: str = "footage"  # Raw recording 1-hour chunks (no processing)
     CHROMA_DB_DIR: str = "./chroma_db"
     CHROMA_COLLECTION_NAME: str = "video_analysis"
+    # Chunk ingestion: completed chunks are coalesced into one ChromaDB write,
+    # flushing at this batch size or after this many seconds of quiet.
+    CHROMA_INGEST_BATCH_SIZE: int = 128
+    CHROMA_INGEST_FLUSH_SECONDS: float = 2.0
+    # Put ChromaDB's SQLite file in WAL mode on first open. WAL lets the
+    # ingest writer proceed while search reads run; journal mode persists
+    # in the database file once set.
+    CHROMA_SQLITE_WAL: bool = True
     
     # Search Settings
     DEFAULT_SEARCH_RESULTS: int = 5
@@ -64,6 +84,8 @@ class Settings(BaseSettings):
 
     # Analysis Settings (when using Qwen rerank: min relevance_score 0–1 to send to VL Flash)
     ANALYSIS_MIN_RELEVANCE_SCORE: float = 0.0
+    # Max concurrent Qwen VL Flash calls per analysis request (respect API rate limits)
+    QWEN_MAX_CONCURRENCY: int = 5
     
     # Authentication Settings
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
@@ -83,6 +105,29 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
+    # Derived immutable values, computed once per settings instance so hot
+    # request paths don't rebuild Paths/dicts on every call.
+    @cached_property
+    def RECORDINGS_PATH(self) -> Path:
+        """Resolved recordings directory."""
+        return Path(self.RECORDINGS_DIR).resolve()
+
+    @cached_property
+    def VIDEO_EXTENSIONS(self) -> FrozenSet[str]:
+        """Lowercase file extensions treated as video files."""
+        return frozenset({".avi", ".mp4", ".mov", ".mkv", ".webm"})
+
+    @cached_property
+    def VIDEO_CONTENT_TYPES(self) -> Dict[str, str]:
+        """Map of video file extension to Content-Type."""
+        return {
+            ".avi": "video/x-msvideo",
+            ".mp4": "video/mp4",
+            ".mov": "video/quicktime",
+            ".mkv": "video/x-matroska",
+            ".webm": "video/webm",
+        }
+
     class Config:
         """Pydantic config."""
         env_file = ".env"
@@ -90,7 +135,7 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
@@ -1,7 +1,10 @@
 """Main FastAPI application."""
 import logging
+import queue
 import subprocess
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List
 
@@ -10,12 +13,13 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings, Settings
 from app.core.logging_config import setup_logging
+from app.utils.json import ORJSONResponse
 # Import routes after services are defined to avoid circular imports
 from app.api.routes import search, analysis, health
 from app.services.r2_uploader import R2Uploader
 from app.services.qwen_client import QwenVLClient
 from app.services.chroma_store import ChromaStore
-from app.services.alert_service import AlertService
+from app.services.alert_service import get_alert_service
 from app.services.tunnel_manager import TunnelManager
 from app.utils.exceptions import R2UploadError, QwenAPIError, ChromaDBError, VideoRecordingError
 
@@ -30,7 +34,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Backend system for recording RTSP streams, processing with Qwen 3 VL models, and providing intelligent search and analysis",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -59,22 +64,27 @@ app.include_router(tunnel.router)
 app.include_router(raw_footage.router)
 app.include_router(billing.router)
 
-# Initialize services (singleton pattern)
+# Initialize services (singleton pattern). The getters run from chunk-worker
+# threads as well as the event loop, so first-use construction is guarded by
+# double-checked locking — two concurrent first chunks must not both open a
+# ChromaDB handle or build an R2 client.
 _qwen_client: Optional[QwenVLClient] = None
 _r2_uploader: Optional[R2Uploader] = None
 _chroma_store: Optional[ChromaStore] = None
-_alert_service: Optional[AlertService] = None
 _tunnel_manager: Optional[TunnelManager] = None
+_service_lock = threading.Lock()
 
 
 def get_qwen_client() -> QwenVLClient:
     """Get or create Qwen client instance."""
     global _qwen_client
     if _qwen_client is None:
-        _qwen_client = QwenVLClient(
-            api_key=settings.QWEN_API_KEY,
-            base_url=settings.QWEN_BASE_URL
-        )
+        with _service_lock:
+            if _qwen_client is None:
+                _qwen_client = QwenVLClient(
+                    api_key=settings.QWEN_API_KEY,
+                    base_url=settings.QWEN_BASE_URL
+                )
     return _qwen_client
 
 
@@ -82,17 +92,19 @@ def get_r2_uploader() -> R2Uploader:
     """Get or create R2 uploader instance."""
     global _r2_uploader
     if _r2_uploader is None:
-        try:
-            _r2_uploader = R2Uploader(
-                account_id=settings.R2_ACCOUNT_ID,
-                access_key_id=settings.R2_ACCESS_KEY_ID,
-                secret_access_key=settings.R2_SECRET_ACCESS_KEY,
-                bucket_name=settings.R2_BUCKET_NAME,
-                public_url_base=settings.R2_PUBLIC_URL_BASE
-            )
-        except R2UploadError as e:
-            logger.warning(f"R2 uploader not initialized: {str(e)}")
-            raise
+        with _service_lock:
+            if _r2_uploader is None:
+                try:
+                    _r2_uploader = R2Uploader(
+                        account_id=settings.R2_ACCOUNT_ID,
+                        access_key_id=settings.R2_ACCESS_KEY_ID,
+                        secret_access_key=settings.R2_SECRET_ACCESS_KEY,
+                        bucket_name=settings.R2_BUCKET_NAME,
+                        public_url_base=settings.R2_PUBLIC_URL_BASE
+                    )
+                except R2UploadError as e:
+                    logger.warning(f"R2 uploader not initialized: {str(e)}")
+                    raise
     return _r2_uploader
 
 
@@ -100,19 +112,17 @@ def get_chroma_store() -> ChromaStore:
     """Get or create ChromaDB store instance."""
     global _chroma_store
     if _chroma_store is None:
-        _chroma_store = ChromaStore(
-            collection_name=settings.CHROMA_COLLECTION_NAME,
-            persist_directory=settings.CHROMA_DB_DIR
-        )
+        with _service_lock:
+            if _chroma_store is None:
+                _chroma_store = ChromaStore(
+                    collection_name=settings.CHROMA_COLLECTION_NAME,
+                    persist_directory=settings.CHROMA_DB_DIR
+                )
     return _chroma_store
 
 
-def get_alert_service() -> AlertService:
-    """Get or create AlertService instance."""
-    global _alert_service
-    if _alert_service is None:
-        _alert_service = AlertService()
-    return _alert_service
+# AlertService holds alert/history state in memory, so the pipeline and the
+# alerts routes must share the one instance owned by the service module.
 
 
 def _on_tunnel_url_change(old_url, new_url):
@@ -375,6 +385,197 @@ def flush_raw_segments() -> None:
                 pass
 
 
+# Completed chunks flow through two fixed worker pools — upload, then Qwen
+# analysis — connected by submit-chaining, instead of one fresh daemon thread
+# per chunk running every step serially. Chunk j's upload then overlaps with
+# chunk j-1's (much slower) inference, and the pools cap concurrency when
+# R2/Qwen latency spikes. The batched ChromaDB flusher below acts as the
+# final store stage.
+_upload_pool: Optional[ThreadPoolExecutor] = None
+_analyze_pool: Optional[ThreadPoolExecutor] = None
+_chunk_pools_lock = threading.Lock()
+
+# The executors' internal queues are unbounded; this semaphore caps queued
+# plus in-flight chunks so a stalled upload/inference path exerts
+# backpressure on the recorder instead of accumulating work without limit.
+_chunk_backlog = threading.BoundedSemaphore(get_settings().CHUNK_QUEUE_MAX)
+
+
+def _get_chunk_pools() -> tuple[ThreadPoolExecutor, ThreadPoolExecutor]:
+    """Get or create the upload and analyze worker pools."""
+    global _upload_pool, _analyze_pool
+    if _upload_pool is None:
+        with _chunk_pools_lock:
+            if _upload_pool is None:
+                _analyze_pool = ThreadPoolExecutor(
+                    max_workers=settings.CHUNK_ANALYZE_WORKERS,
+                    thread_name_prefix="ChunkAnalyzer"
+                )
+                _upload_pool = ThreadPoolExecutor(
+                    max_workers=settings.CHUNK_WORKERS,
+                    thread_name_prefix="ChunkUploader"
+                )
+    return _upload_pool, _analyze_pool
+
+
+# Completed chunk analyses are coalesced into batched ChromaDB writes by a
+# single background flusher so each write pays the transaction cost once.
+_chroma_ingest_queue: "queue.Queue[dict]" = queue.Queue()
+_chroma_flusher_started = threading.Event()
+
+
+def _ensure_chroma_flusher() -> None:
+    """Start the ChromaDB ingest flusher thread on first use.
+
+    Double-checked like the service getters: two analyze workers finishing
+    their first chunks concurrently must not both start a drainer.
+    """
+    if _chroma_flusher_started.is_set():
+        return
+    with _service_lock:
+        if _chroma_flusher_started.is_set():
+            return
+        _chroma_flusher_started.set()
+        thread = threading.Thread(target=_chroma_ingest_flusher, daemon=True, name="ChromaIngestFlusher")
+        thread.start()
+
+
+def _chroma_ingest_flusher() -> None:
+    """Drain queued analyses into batched ChromaDB writes."""
+    while True:
+        entries = [_chroma_ingest_queue.get()]
+        deadline = time.monotonic() + settings.CHROMA_INGEST_FLUSH_SECONDS
+        while len(entries) < settings.CHROMA_INGEST_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                entries.append(_chroma_ingest_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+
+        try:
+            chroma_store = get_chroma_store()
+            chroma_store.add_video_analyses(entries)
+            logger.info(f"Stored {len(entries)} chunk analysis(es) in ChromaDB")
+        except ChromaDBError as e:
+            logger.error(f"ChromaDB error storing batched chunk analyses: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error storing batched chunk analyses: {str(e)}", exc_info=True)
+
+
+# R2 upload retry policy: a transient blip shouldn't lose a chunk's analysis.
+_R2_UPLOAD_ATTEMPTS = 3
+
+
+def _upload_chunk(chunk_path: str) -> None:
+    """Pipeline stage 1: upload the chunk to R2, then hand off to analysis."""
+    try:
+        logger.info(f"Processing chunk: {chunk_path}")
+        r2_uploader = get_r2_uploader()
+        for attempt in range(_R2_UPLOAD_ATTEMPTS):
+            try:
+                public_url = r2_uploader.upload_file(chunk_path)
+                break
+            except R2UploadError as e:
+                if attempt + 1 == _R2_UPLOAD_ATTEMPTS:
+                    raise
+                delay = 2 ** attempt
+                logger.warning(
+                    "R2 upload failed for chunk %s (attempt %d/%d), retrying in %ds: %s",
+                    chunk_path, attempt + 1, _R2_UPLOAD_ATTEMPTS, delay, e
+                )
+                time.sleep(delay)
+        logger.info(f"Uploaded to: {public_url}")
+    except R2UploadError as e:
+        logger.error(f"R2 upload error for chunk {chunk_path}: {str(e)}")
+        _chunk_backlog.release()
+        return
+    except Exception as e:
+        logger.error(f"Unexpected error uploading chunk {chunk_path}: {str(e)}", exc_info=True)
+        _chunk_backlog.release()
+        return
+
+    _, analyze_pool = _get_chunk_pools()
+    analyze_pool.submit(_analyze_chunk, chunk_path, public_url)
+
+
+def _analyze_chunk(chunk_path: str, public_url: str) -> None:
+    """Pipeline stage 2: run Qwen analysis and queue the result for storage."""
+    try:
+        # Get enabled alerts
+        alert_service = get_alert_service()
+        enabled_alerts = alert_service.get_enabled_alerts()
+
+        # Prepare alerts for Qwen (list of dicts with 'id' and 'query')
+        alerts_for_qwen = [
+            {"id": alert["id"], "query": alert["query"]}
+            for alert in enabled_alerts
+        ]
+
+        # Process with Qwen 3 VL Plus (with alerts injected)
+        # Use video_preprompt from device config if available, otherwise fall back to .env
+        from app.services.device_config_service import get_device_config
+        _dcfg = get_device_config()
+        preprompt = (_dcfg or {}).get("video_preprompt", "").strip() or settings.VIDEO_PREPROMPT
+        qwen_client = get_qwen_client()
+        analysis = qwen_client.process_video_plus(
+            video_url=public_url,
+            preprompt=preprompt,
+            fps=settings.VIDEO_FPS,
+            alerts=alerts_for_qwen if alerts_for_qwen else None
+        )
+        logger.info("Analysis complete")
+
+        chunk_filename = Path(chunk_path).name
+
+        # Parse alert responses if alerts were checked
+        if alerts_for_qwen:
+            alert_ids = [alert["id"] for alert in alerts_for_qwen]
+            analysis_content = analysis.get("choices", [{}])[0].get("message", {}).get("content", "")
+            alert_results = QwenVLClient.parse_alert_responses(analysis_content, alert_ids)
+
+            # Log triggered alerts
+            alerts_by_id = {a["id"]: a for a in enabled_alerts}
+            for alert_id, triggered in alert_results.items():
+                if triggered:
+                    alert = alerts_by_id.get(alert_id)
+                    if alert:
+                        # Extract a snippet of the analysis (first 200 chars)
+                        analysis_snippet = analysis_content[:200] if analysis_content else None
+                        alert_service.add_alert_history(
+                            alert_id=alert_id,
+                            alert_query=alert["query"],
+                            video_url=public_url,
+                            local_path=chunk_filename,
+                            analysis_snippet=analysis_snippet
+                        )
+                        logger.info(f"Alert triggered: {alert_id} - {alert['query']}")
+
+        # Queue for ChromaDB with local path for video serving; the flusher
+        # batches concurrent chunks into a single write.
+        _ensure_chroma_flusher()
+        _chroma_ingest_queue.put({
+            "video_url": public_url,
+            "analysis_json": analysis,
+            "metadata": {"local_path": chunk_filename}  # Store filename for local serving
+        })
+        logger.info("Queued for ChromaDB")
+
+        # Optionally delete local file to save space
+        # import os
+        # os.remove(chunk_path)
+
+    except QwenAPIError as e:
+        logger.error(f"Qwen API error for chunk {chunk_path}: {str(e)}")
+    except ChromaDBError as e:
+        logger.error(f"ChromaDB error for chunk {chunk_path}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected error processing chunk {chunk_path}: {str(e)}", exc_info=True)
+    finally:
+        _chunk_backlog.release()
+
+
 def chunk_callback(chunk_path: str) -> None:
     """
     Callback function when a video chunk is complete.
@@ -382,90 +583,14 @@ def chunk_callback(chunk_path: str) -> None:
     Args:
         chunk_path: Path to the completed video chunk
     """
-    def process_chunk():
-        """Process chunk in background thread."""
-        try:
-            # Upload to R2
-            logger.info(f"Processing chunk: {chunk_path}")
-            r2_uploader = get_r2_uploader()
-            public_url = r2_uploader.upload_file(chunk_path)
-            logger.info(f"Uploaded to: {public_url}")
-            
-            # Get enabled alerts
-            alert_service = get_alert_service()
-            enabled_alerts = alert_service.get_enabled_alerts()
-            
-            # Prepare alerts for Qwen (list of dicts with 'id' and 'query')
-            alerts_for_qwen = [
-                {"id": alert["id"], "query": alert["query"]}
-                for alert in enabled_alerts
-            ]
-            
-            # Process with Qwen 3 VL Plus (with alerts injected)
-            # Use video_preprompt from device config if available, otherwise fall back to .env
-            from app.services.device_config_service import get_device_config
-            _dcfg = get_device_config()
-            preprompt = (_dcfg or {}).get("video_preprompt", "").strip() or settings.VIDEO_PREPROMPT
-            qwen_client = get_qwen_client()
-            analysis = qwen_client.process_video_plus(
-                video_url=public_url,
-                preprompt=preprompt,
-                fps=settings.VIDEO_FPS,
-                alerts=alerts_for_qwen if alerts_for_qwen else None
-            )
-            logger.info("Analysis complete")
-            
-            # Parse alert responses if alerts were checked
-            if alerts_for_qwen:
-                alert_ids = [alert["id"] for alert in alerts_for_qwen]
-                analysis_content = analysis.get("choices", [{}])[0].get("message", {}).get("content", "")
-                alert_results = QwenVLClient.parse_alert_responses(analysis_content, alert_ids)
-                
-                # Log triggered alerts
-                from pathlib import Path
-                chunk_filename = Path(chunk_path).name
-                for alert_id, triggered in alert_results.items():
-                    if triggered:
-                        alert = next((a for a in enabled_alerts if a["id"] == alert_id), None)
-                        if alert:
-                            # Extract a snippet of the analysis (first 200 chars)
-                            analysis_snippet = analysis_content[:200] if analysis_content else None
-                            alert_service.add_alert_history(
-                                alert_id=alert_id,
-                                alert_query=alert["query"],
-                                video_url=public_url,
-                                local_path=chunk_filename,
-                                analysis_snippet=analysis_snippet
-                            )
-                            logger.info(f"Alert triggered: {alert_id} - {alert['query']}")
-            
-            # Store in ChromaDB with local path for video serving
-            chroma_store = get_chroma_store()
-            from pathlib import Path
-            chunk_filename = Path(chunk_path).name
-            chroma_store.add_video_analysis(
-                video_url=public_url,
-                analysis_json=analysis,
-                metadata={"local_path": chunk_filename}  # Store filename for local serving
-            )
-            logger.info("Stored in ChromaDB")
-            
-            # Optionally delete local file to save space
-            # import os
-            # os.remove(chunk_path)
-            
-        except R2UploadError as e:
-            logger.error(f"R2 upload error for chunk {chunk_path}: {str(e)}")
-        except QwenAPIError as e:
-            logger.error(f"Qwen API error for chunk {chunk_path}: {str(e)}")
-        except ChromaDBError as e:
-            logger.error(f"ChromaDB error for chunk {chunk_path}: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error processing chunk {chunk_path}: {str(e)}", exc_info=True)
-    
-    # Process chunk in background thread
-    thread = threading.Thread(target=process_chunk, daemon=True, name="ChunkProcessor")
-    thread.start()
+    # Enter the pipeline, waiting briefly for a backlog slot. If it is
+    # saturated past the timeout, skip this chunk — the recorder has
+    # already persisted the file to disk.
+    if not _chunk_backlog.acquire(timeout=settings.CHUNK_QUEUE_TIMEOUT):
+        logger.error(f"Chunk pipeline saturated, skipping processing for {chunk_path}")
+        return
+    upload_pool, _ = _get_chunk_pools()
+    upload_pool.submit(_upload_chunk, chunk_path)
 
 
 @app.on_event("startup")
@@ -476,6 +601,15 @@ async def startup_event():
     if not settings.QWEN_API_KEY:
         logger.warning("QWEN_API_KEY not set")
 
+    # Request/response model validation runs on every request; make sure the
+    # compiled pydantic-core extension is active rather than a slow fallback.
+    try:
+        import pydantic_core
+        if pydantic_core._pydantic_core.__file__.endswith(".py"):
+            logger.warning("pydantic-core is running without its compiled extension; validation will be slow")
+    except Exception:
+        logger.warning("Could not verify pydantic-core compiled extension")
+
     from app.core.startup_orchestrator import run_startup_sequence
     run_startup_sequence()
 
@@ -507,6 +641,12 @@ async def shutdown_event():
     if _tunnel_manager is not None:
         _tunnel_manager.stop_tunnel()
 
+    # Let in-flight chunk processing finish before the process exits
+    if _upload_pool is not None:
+        _upload_pool.shutdown(wait=True, cancel_futures=False)
+    if _analyze_pool is not None:
+        _analyze_pool.shutdown(wait=True, cancel_futures=False)
+
 
 if __name__ == "__main__":
     import uvicorn
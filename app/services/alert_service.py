@@ -1,15 +1,43 @@
 """Alert management service."""
-import json
 import logging
-from datetime import datetime
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import uuid
 
-from app.core.config import get_settings
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Shared instance: alerts/history live in memory with write-through, so the
+# API routes and the chunk pipeline must read and mutate the SAME object —
+# two instances would clobber each other's alerts.json on save.
+_alert_service: Optional["AlertService"] = None
+_service_lock = threading.Lock()
+
+
+def get_alert_service() -> "AlertService":
+    """Get or create the shared AlertService instance."""
+    global _alert_service
+    if _alert_service is None:
+        with _service_lock:
+            if _alert_service is None:
+                _alert_service = AlertService()
+    return _alert_service
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an unambiguous ISO string.
+
+    datetime.now() resolved the local timezone per call and stored a
+    zone-less string; fixed-offset UTC skips that lookup and makes the
+    stored timestamps comparable across host timezone changes.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
 
 class AlertService:
     """Manages alert rules and history."""
@@ -22,57 +50,99 @@ class AlertService:
             alerts_file: Path to alerts JSON file
             history_file: Path to alert history JSON file
         """
-        settings = get_settings()
         self.alerts_file = Path(alerts_file or "alerts.json")
-        self.history_file = Path(history_file or "alert_history.json")
-        
+        # History is append-only JSON lines (oldest first on disk); a
+        # trigger appends one line instead of rewriting the whole file.
+        self.history_file = Path(history_file or "alert_history.jsonl")
+        self._history_lines = 0
+
+        # Alerts and history live in memory (read once here) and are
+        # persisted write-through on mutation; reads — one per processed
+        # chunk for get_enabled_alerts — no longer touch the disk.
+        self._lock = threading.RLock()
+        self._alerts: Dict[str, Dict] = self._load_alerts()
+        # Newest-first, auto-evicting at the retention cap: appendleft is
+        # O(1) where list.insert(0, ...) shifted up to 1000 entries.
+        self._history: "deque[Dict]" = deque(self._load_history(), maxlen=1000)
+
         # Create files if they don't exist
         if not self.alerts_file.exists():
-            self._save_alerts({})
+            self._save_alerts(self._alerts)
         if not self.history_file.exists():
-            self._save_history([])
-        
+            self._save_history(list(self._history))
+
         logger.info("AlertService initialized")
     
+    # orjson serializes datetimes natively (no default=str callback) and
+    # emits bytes directly, keeping the write-through saves cheap.
+    _DUMP_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+
+    # Compact the JSONL file (drop evicted lines) once it grows past this.
+    _HISTORY_COMPACT_LINES = 2000
+
     def _load_alerts(self) -> Dict[str, Dict]:
         """Load alerts from file."""
         try:
             if self.alerts_file.exists():
-                with open(self.alerts_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return orjson.loads(self.alerts_file.read_bytes())
             return {}
         except Exception as e:
             logger.error(f"Error loading alerts: {e}")
             return {}
-    
+
     def _save_alerts(self, alerts: Dict[str, Dict]) -> None:
         """Save alerts to file."""
         try:
-            with open(self.alerts_file, 'w', encoding='utf-8') as f:
-                json.dump(alerts, f, indent=2, default=str)
+            self.alerts_file.write_bytes(orjson.dumps(alerts, option=self._DUMP_OPTS))
         except Exception as e:
             logger.error(f"Error saving alerts: {e}")
             raise
-    
+
     def _load_history(self) -> List[Dict]:
-        """Load alert history from file."""
+        """Load alert history (newest first), keeping the last 1000 lines."""
         try:
             if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                total = 0
+                lines: "deque[bytes]" = deque(maxlen=1000)
+                with open(self.history_file, 'rb') as f:
+                    for line in f:
+                        total += 1
+                        lines.append(line)
+                self._history_lines = total
+                entries = [orjson.loads(line) for line in lines if line.strip()]
+                entries.reverse()  # on-disk order is oldest first
+                return entries
+            # Migrate from the legacy single-array JSON file if present
+            legacy = self.history_file.with_suffix(".json")
+            if legacy.exists():
+                return orjson.loads(legacy.read_bytes())
             return []
         except Exception as e:
             logger.error(f"Error loading alert history: {e}")
             return []
-    
+
     def _save_history(self, history: List[Dict]) -> None:
-        """Save alert history to file."""
+        """Rewrite (compact) the history file as JSON lines, oldest first."""
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(history, f, indent=2, default=str)
+            self.history_file.write_bytes(
+                b"".join(orjson.dumps(entry) + b"\n" for entry in reversed(history))
+            )
+            self._history_lines = len(history)
         except Exception as e:
             logger.error(f"Error saving alert history: {e}")
             raise
+
+    def _append_history(self, entry: Dict) -> None:
+        """Append one history entry; compact once evicted lines pile up."""
+        try:
+            with open(self.history_file, 'ab') as f:
+                f.write(orjson.dumps(entry) + b"\n")
+            self._history_lines += 1
+            if self._history_lines > self._HISTORY_COMPACT_LINES:
+                self._save_history(list(self._history))
+        except Exception as e:
+            logger.error(f"Error appending alert history: {e}")
+            raise
     
     def create_alert(self, query: str, enabled: bool = True) -> Dict:
         """
@@ -85,36 +155,36 @@ class AlertService:
         Returns:
             Created alert dictionary
         """
-        alerts = self._load_alerts()
         alert_id = str(uuid.uuid4())
-        
+
         alert = {
             "id": alert_id,
             "query": query,
             "enabled": enabled,
-            "created_at": datetime.now().isoformat(),
+            "created_at": _utc_timestamp(),
             "trigger_count": 0
         }
-        
-        alerts[alert_id] = alert
-        self._save_alerts(alerts)
+
+        with self._lock:
+            self._alerts[alert_id] = alert
+            self._save_alerts(self._alerts)
         logger.info(f"Created alert: {alert_id} - {query}")
         return alert
     
     def get_alert(self, alert_id: str) -> Optional[Dict]:
         """Get alert by ID."""
-        alerts = self._load_alerts()
-        return alerts.get(alert_id)
+        with self._lock:
+            return self._alerts.get(alert_id)
     
     def get_all_alerts(self) -> List[Dict]:
         """Get all alerts."""
-        alerts = self._load_alerts()
-        return list(alerts.values())
+        with self._lock:
+            return list(self._alerts.values())
     
     def get_enabled_alerts(self) -> List[Dict]:
         """Get all enabled alerts."""
-        alerts = self._load_alerts()
-        return [alert for alert in alerts.values() if alert.get("enabled", True)]
+        with self._lock:
+            return [alert for alert in self._alerts.values() if alert.get("enabled", True)]
     
     def update_alert(self, alert_id: str, query: Optional[str] = None, enabled: Optional[bool] = None) -> Optional[Dict]:
         """
@@ -128,18 +198,19 @@ class AlertService:
         Returns:
             Updated alert dictionary or None if not found
         """
-        alerts = self._load_alerts()
-        if alert_id not in alerts:
-            return None
-        
-        if query is not None:
-            alerts[alert_id]["query"] = query
-        if enabled is not None:
-            alerts[alert_id]["enabled"] = enabled
-        
-        self._save_alerts(alerts)
+        with self._lock:
+            if alert_id not in self._alerts:
+                return None
+
+            if query is not None:
+                self._alerts[alert_id]["query"] = query
+            if enabled is not None:
+                self._alerts[alert_id]["enabled"] = enabled
+
+            self._save_alerts(self._alerts)
+            alert = self._alerts[alert_id]
         logger.info(f"Updated alert: {alert_id}")
-        return alerts[alert_id]
+        return alert
     
     def delete_alert(self, alert_id: str) -> bool:
         """
@@ -151,12 +222,12 @@ class AlertService:
         Returns:
             True if deleted, False if not found
         """
-        alerts = self._load_alerts()
-        if alert_id not in alerts:
-            return False
-        
-        del alerts[alert_id]
-        self._save_alerts(alerts)
+        with self._lock:
+            if alert_id not in self._alerts:
+                return False
+
+            del self._alerts[alert_id]
+            self._save_alerts(self._alerts)
         logger.info(f"Deleted alert: {alert_id}")
         return True
     
@@ -178,32 +249,26 @@ class AlertService:
             local_path: Local filename for video serving
             analysis_snippet: Snippet of analysis that triggered alert
         """
-        history = self._load_history()
-        
         entry = {
             "id": str(uuid.uuid4()),
             "alert_id": alert_id,
             "alert_query": alert_query,
             "video_url": video_url,
             "local_path": local_path,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _utc_timestamp(),
             "analysis_snippet": analysis_snippet
         }
-        
-        history.insert(0, entry)  # Add to beginning
-        
-        # Keep only last 1000 entries
-        if len(history) > 1000:
-            history = history[:1000]
-        
-        self._save_history(history)
-        
-        # Update trigger count
-        alerts = self._load_alerts()
-        if alert_id in alerts:
-            alerts[alert_id]["trigger_count"] = alerts[alert_id].get("trigger_count", 0) + 1
-            self._save_alerts(alerts)
-        
+
+        with self._lock:
+            self._history.appendleft(entry)  # maxlen evicts the oldest
+
+            self._append_history(entry)
+
+            # Update trigger count
+            if alert_id in self._alerts:
+                self._alerts[alert_id]["trigger_count"] = self._alerts[alert_id].get("trigger_count", 0) + 1
+                self._save_alerts(self._alerts)
+
         logger.info(f"Alert triggered: {alert_id} - {alert_query}")
     
     def get_alert_history(self, limit: int = 100) -> List[Dict]:
@@ -216,5 +281,21 @@ class AlertService:
         Returns:
             List of alert history entries
         """
-        history = self._load_history()
-        return history[:limit]
+        with self._lock:
+            return list(islice(self._history, max(0, limit)))
+
+    def iter_alert_history(self, limit: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over alert history entries (newest first).
+
+        Args:
+            limit: Maximum number of entries to yield
+
+        Yields:
+            Alert history entry dictionaries
+        """
+        with self._lock:
+            # Clamp: islice raises ValueError on negative stops
+            snapshot = list(islice(self._history, max(0, limit)))
+        for entry in snapshot:
+            yield entry
@@ -1,9 +1,15 @@
 """JWT authentication service."""
+import hashlib
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 
-from jose import JWTError, jwt
+import orjson
+from jose import jws, jwt
+from jose.exceptions import JOSEError
 from fastapi import HTTPException, status
 
 from app.core.config import get_settings
@@ -11,6 +17,21 @@ from app.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
 
+# Resolved token -> user entries are cached briefly so that every protected
+# route doesn't re-run JWT decode + a user DB lookup per request.
+_USER_CACHE_TTL_SECONDS = 15
+_USER_CACHE_MAX_ENTRIES = 10_000
+
+# Single writer for bookkeeping DB updates the login response needn't wait on.
+_login_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LoginWriter")
+
+
+def _log_login_write_failure(future) -> None:
+    """Surface background last-login UPDATE failures in the logs."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(f"Background last-login update failed: {exc}")
+
 
 class AuthService:
     """Handles JWT token generation and verification."""
@@ -19,6 +40,13 @@ class AuthService:
         """Initialize auth service."""
         self.settings = get_settings()
         self.user_service = UserService()
+        # Precompute decode inputs once; HS256 key bytes, algorithm list, and
+        # static options would otherwise be rebuilt on every verify_token call.
+        self._jwt_key = self.settings.JWT_SECRET_KEY
+        self._jwt_algorithms = [self.settings.JWT_ALGORITHM]
+        # Keyed by sha256(token) so raw tokens are not held in memory.
+        self._user_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._user_cache_lock = threading.Lock()
     
     def create_access_token(self, user_id: int, email: str) -> str:
         """
@@ -42,7 +70,7 @@ class AuthService:
         
         token = jwt.encode(
             payload,
-            self.settings.JWT_SECRET_KEY,
+            self._jwt_key,
             algorithm=self.settings.JWT_ALGORITHM
         )
         
@@ -62,19 +90,34 @@ class AuthService:
             HTTPException: If token is invalid or expired
         """
         try:
-            payload = jwt.decode(
+            # Verify the signature with jws and parse the payload with orjson;
+            # jose's jwt.decode is hardwired to stdlib json, which is the
+            # slowest part of this call once the key inputs are precomputed.
+            payload_bytes = jws.verify(
                 token,
-                self.settings.JWT_SECRET_KEY,
-                algorithms=[self.settings.JWT_ALGORITHM]
+                self._jwt_key,
+                algorithms=self._jwt_algorithms
             )
-            return payload
-        except JWTError as e:
+            payload = orjson.loads(payload_bytes)
+        except (JOSEError, orjson.JSONDecodeError) as e:
             logger.warning(f"Token verification failed: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+
+        # jws.verify checks the signature only; enforce expiry ourselves.
+        exp = payload.get("exp")
+        if exp is not None and exp < time.time():
+            logger.warning("Token verification failed: token expired")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid authentication credentials",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        return payload
     
     def authenticate_user(self, email: str, password: str) -> Optional[Dict]:
         """
@@ -94,8 +137,11 @@ class AuthService:
         if not self.user_service.verify_password(password, user["hashed_password"]):
             return None
         
-        # Update last login
-        self.user_service.update_last_login(user["id"])
+        # Update last login off the critical path; the caller doesn't need
+        # to wait on this bookkeeping UPDATE before issuing the token. The
+        # done-callback keeps write failures observable in the logs.
+        future = _login_writer.submit(self.user_service.update_last_login, user["id"])
+        future.add_done_callback(_log_login_write_failure)
         
         return {
             "id": user["id"],
@@ -103,19 +149,46 @@ class AuthService:
             "created_at": user["created_at"]
         }
     
+    def _get_cached_user(self, cache_key: str) -> Optional[Dict]:
+        """Return a cached user for the token hash if still fresh."""
+        with self._user_cache_lock:
+            entry = self._user_cache.get(cache_key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            if entry:
+                del self._user_cache[cache_key]
+        return None
+
+    def _cache_user(self, cache_key: str, user: Dict) -> None:
+        """Cache a resolved user for the token hash with a short TTL."""
+        with self._user_cache_lock:
+            if len(self._user_cache) >= _USER_CACHE_MAX_ENTRIES:
+                self._user_cache.clear()
+            self._user_cache[cache_key] = (time.monotonic() + _USER_CACHE_TTL_SECONDS, user)
+
+    def invalidate_user_cache(self) -> None:
+        """Drop all cached token -> user entries (e.g. after a password change)."""
+        with self._user_cache_lock:
+            self._user_cache.clear()
+
     def get_current_user(self, token: str) -> Dict:
         """
         Get current user from token.
-        
+
         Args:
             token: JWT token
-            
+
         Returns:
             User dictionary
-            
+
         Raises:
             HTTPException: If token is invalid or user not found
         """
+        cache_key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._get_cached_user(cache_key)
+        if cached is not None:
+            return cached
+
         payload = self.verify_token(token)
         user_id = int(payload.get("sub"))
         
@@ -126,9 +199,11 @@ class AuthService:
                 detail="User not found",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        
-        return {
+
+        result = {
             "id": user["id"],
             "email": user["email"],
             "created_at": user["created_at"]
         }
+        self._cache_user(cache_key, result)
+        return result
@@ -1,11 +1,20 @@
 """ChromaDB storage service."""
 import logging
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.services.qwen_client import QwenVLClient
-import json
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
+from pathlib import Path
+
+import numpy as np
+import orjson
 
 import chromadb
 from chromadb.config import Settings
@@ -22,10 +31,154 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# PersistentClient and collection handles are memoized per path/name:
+# constructing a client opens SQLite and loads index metadata, which is far
+# too expensive to repeat for every ChromaStore() a request handler builds.
+_clients: Dict[str, chromadb.PersistentClient] = {}
+_collections: Dict[Tuple[str, str], Any] = {}
+_pool_lock = threading.Lock()
+
+# Dashboard snapshot cache: (persist_dir, collection) -> (deadline, payload).
+# Module-level because ChromaStore instances are built per request.
+_snapshot_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_snapshot_lock = threading.Lock()
+
+# Available-dates cache: (persist_dir, collection) -> state dict with the
+# collection count it was computed at, the newest timestamp seen, the date
+# set, and the sorted list. Dates only change when ingest adds rows, so a
+# matching count means the cached answer is still exact.
+_dates_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_dates_lock = threading.Lock()
+
+
+def _enable_sqlite_wal(persist_directory: str) -> None:
+    """Best-effort switch of Chroma's SQLite file to WAL journal mode.
+
+    WAL keeps readers unblocked while the ingest batches write. The journal
+    mode is a property of the database file, so setting it from our own
+    short-lived connection carries over to Chroma's connections. Failures
+    (locked file, missing db) are logged and ignored.
+    """
+    db_path = Path(persist_directory) / "chroma.sqlite3"
+    if not db_path.exists():
+        return
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=5)
+        try:
+            mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()
+            logger.info(f"ChromaDB sqlite journal_mode={mode[0] if mode else 'unknown'}")
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not enable WAL on {db_path}: {e}")
+
+
+def _ensure_timestamp_index(persist_directory: str) -> None:
+    """Best-effort partial index on the timestamp_unix metadata rows.
+
+    Every time filter in this store is a range predicate on
+    timestamp_unix; without an index those degrade to full scans of
+    embedding_metadata as the collection grows. The index lives in the
+    database file, so creating it from our own connection benefits
+    Chroma's queries. Schema drift across chromadb versions is tolerated
+    by logging and ignoring failures.
+    """
+    db_path = Path(persist_directory) / "chroma.sqlite3"
+    if not db_path.exists():
+        return
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=5)
+        try:
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_metadata_timestamp_unix "
+                "ON embedding_metadata(key, float_value) "
+                "WHERE key = 'timestamp_unix'"
+            )
+            conn.execute("ANALYZE embedding_metadata")
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Could not ensure timestamp index on {db_path}: {e}")
+
+
+def _get_client(persist_directory: str) -> chromadb.PersistentClient:
+    """Get or create the shared PersistentClient for a data directory."""
+    client = _clients.get(persist_directory)
+    if client is None:
+        with _pool_lock:
+            client = _clients.get(persist_directory)
+            if client is None:
+                # Apply the sqlite tweaks BEFORE the client exists: switching
+                # the journal mode and creating the index from an external
+                # connection while the embedded client holds the file open
+                # risks corrupting it mid-compaction.
+                if get_settings().CHROMA_SQLITE_WAL:
+                    _enable_sqlite_wal(persist_directory)
+                _ensure_timestamp_index(persist_directory)
+                client = chromadb.PersistentClient(
+                    path=persist_directory,
+                    settings=Settings(anonymized_telemetry=False)
+                )
+                _clients[persist_directory] = client
+    return client
+
+
+def _get_collection(persist_directory: str, collection_name: str):
+    """Get or create the shared collection handle."""
+    key = (persist_directory, collection_name)
+    collection = _collections.get(key)
+    if collection is None:
+        with _pool_lock:
+            collection = _collections.get(key)
+            if collection is None:
+                collection = _get_client(persist_directory).get_or_create_collection(
+                    name=collection_name,
+                    metadata={"hnsw:space": "cosine"}
+                )
+                _collections[key] = collection
+    return collection
+
+
+@lru_cache(maxsize=64)
+def _date_bounds(target_date: date) -> Tuple[float, float]:
+    """(start, end) unix timestamps spanning 00:00:00 to 23:59:59.999999.
+
+    Date objects hash cheaply and dashboards hit the same few dates
+    repeatedly, so the timestamp conversion is memoized per date. Both
+    bounds come from local wall-clock times — DST-transition days are not
+    86400 seconds long, so a fixed offset from midnight would be wrong.
+    """
+    start = datetime.combine(target_date, datetime.min.time()).timestamp()
+    end = datetime.combine(target_date, datetime.max.time()).timestamp()
+    return start, end
+
+
+def _unique_dates(timestamps: List[float]) -> set:
+    """Distinct local ISO dates for a list of unix timestamps.
+
+    Deduplicates to unique minute buckets in numpy first, then converts
+    only those: timezone offsets (incl. DST) are whole minutes, so a UTC
+    minute never straddles a local date boundary and the result matches
+    per-row datetime.fromtimestamp exactly — without allocating a
+    datetime per metadata row.
+    """
+    if not timestamps:
+        return set()
+    minutes = np.unique((np.asarray(timestamps, dtype=np.float64) // 60.0).astype(np.int64))
+    return {datetime.fromtimestamp(m * 60).date().isoformat() for m in minutes}
+
 
 class ChromaStore:
     """Manages ChromaDB storage for video links and analysis results."""
-    
+
+    # clear_all deletes ids in batches of this size to bound peak memory.
+    _CLEAR_BATCH_SIZE = 10_000
+
+    # Dashboard snapshot freshness window (see get_dashboard_snapshot).
+    _SNAPSHOT_TTL_SECONDS = 30.0
+
+
     def __init__(
         self,
         collection_name: Optional[str] = None,
@@ -41,22 +194,83 @@ class ChromaStore:
         settings = get_settings()
         self.collection_name = collection_name or settings.CHROMA_COLLECTION_NAME
         self.persist_directory = persist_directory or settings.CHROMA_DB_DIR
+        # Full analysis payloads live as sidecar files keyed by doc id;
+        # metadata carries only the small analysis_path reference.
+        self._analyses_dir = Path(self.persist_directory) / "analyses"
+        self._analyses_dir.mkdir(parents=True, exist_ok=True)
+        # Bind query-path scalars once; search_clips reads them per call.
+        self._default_results = settings.DEFAULT_SEARCH_RESULTS
+        self._max_results = settings.MAX_SEARCH_RESULTS
+        self._min_relevance_score = settings.CLIP_MIN_RELEVANCE_SCORE
+        self._rerank_max_chars = settings.QWEN_RERANK_MAX_CHARS_PER_DOC
+        self._rerank_max_docs = settings.QWEN_RERANK_MAX_DOCS
+        self._rerank_overfetch = settings.QWEN_RERANK_OVERFETCH
         
         try:
-            self.client = chromadb.PersistentClient(
-                path=self.persist_directory,
-                settings=Settings(anonymized_telemetry=False)
-            )
-            self.collection = self.client.get_or_create_collection(
-                name=self.collection_name,
-                metadata={"hnsw:space": "cosine"}
-            )
+            self.client = _get_client(self.persist_directory)
+            self.collection = _get_collection(self.persist_directory, self.collection_name)
             logger.info(f"ChromaDB initialized: collection={self.collection_name}")
         except ChromaError as e:
             raise ChromaDBError(f"Failed to initialize ChromaDB: {str(e)}") from e
         except Exception as e:
             raise ChromaDBError(f"Unexpected error initializing ChromaDB: {str(e)}") from e
     
+    def _build_entry(
+        self,
+        video_url: str,
+        analysis_json: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        """
+        Build (doc_id, document, metadata) for one video analysis entry.
+
+        Args:
+            video_url: Public URL of the video
+            analysis_json: JSON response from Qwen 3 VL Plus
+            metadata: Optional additional metadata
+
+        Returns:
+            Tuple of (doc_id, document content, metadata dict)
+        """
+        # Serialize once (orjson); stdlib json.dumps ran twice per add on
+        # responses that can be hundreds of KB.
+        serialized = orjson.dumps(analysis_json)
+
+        # Extract text content from analysis for embedding
+        if isinstance(analysis_json, dict):
+            # Try to extract content from the response
+            if "choices" in analysis_json:
+                content = analysis_json["choices"][0]["message"]["content"]
+            elif "content" in analysis_json:
+                content = analysis_json["content"]
+            else:
+                content = serialized.decode()
+        else:
+            content = str(analysis_json)
+
+        # Timestamp alone can collide under concurrent adds; a short uuid
+        # suffix makes ids unique without a coordination point.
+        now_ts = time.time()
+        doc_id = f"video_{now_ts:.6f}_{uuid.uuid4().hex[:8]}"
+
+        # The full payload goes to a sidecar file; storing it inline in
+        # metadata made every metadatas projection haul the blob through
+        # SQLite. get_analysis() reads it back on demand.
+        analysis_path = self._analyses_dir / f"{doc_id}.json"
+        analysis_path.write_bytes(serialized)
+
+        doc_metadata = {
+            "video_url": video_url,
+            "timestamp": datetime.fromtimestamp(now_ts).isoformat(),
+            "timestamp_unix": now_ts,  # Numeric timestamp for filtering
+            "analysis_path": analysis_path.name
+        }
+
+        if metadata:
+            doc_metadata.update(metadata)
+
+        return doc_id, content, doc_metadata
+
     def add_video_analysis(
         self,
         video_url: str,
@@ -65,57 +279,31 @@ class ChromaStore:
     ) -> str:
         """
         Add video analysis to ChromaDB.
-        
+
         Args:
             video_url: Public URL of the video
             analysis_json: JSON response from Qwen 3 VL Plus
             metadata: Optional additional metadata
-        
+
         Returns:
             Document ID
-        
+
         Raises:
             ChromaDBError: If storage fails
         """
         try:
-            # Extract text content from analysis for embedding
-            if isinstance(analysis_json, dict):
-                # Try to extract content from the response
-                content = ""
-                if "choices" in analysis_json:
-                    content = analysis_json["choices"][0]["message"]["content"]
-                elif "content" in analysis_json:
-                    content = analysis_json["content"]
-                else:
-                    content = json.dumps(analysis_json)
-            else:
-                content = str(analysis_json)
-            
-            # Prepare metadata
-            now = datetime.now()
-            doc_metadata = {
-                "video_url": video_url,
-                "timestamp": now.isoformat(),
-                "timestamp_unix": now.timestamp(),  # Numeric timestamp for filtering
-                "analysis": json.dumps(analysis_json)
-            }
-            
-            if metadata:
-                doc_metadata.update(metadata)
-            
-            # Generate unique ID
-            doc_id = f"video_{datetime.now().timestamp()}"
-            
+            doc_id, content, doc_metadata = self._build_entry(video_url, analysis_json, metadata)
+
             # Add to collection
             self.collection.add(
                 documents=[content],
                 metadatas=[doc_metadata],
                 ids=[doc_id]
             )
-            
+
             logger.info(f"Added video analysis to ChromaDB: {doc_id}")
             return doc_id
-            
+
         except ChromaError as e:
             error_msg = f"ChromaDB error adding video analysis: {str(e)}"
             logger.error(error_msg)
@@ -124,6 +312,58 @@ class ChromaStore:
             error_msg = f"Unexpected error adding video analysis: {str(e)}"
             logger.error(error_msg)
             raise ChromaDBError(error_msg) from e
+
+    def add_video_analyses(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Add multiple video analyses to ChromaDB in a single batched write.
+
+        One collection.add with N entries pays the SQLite transaction and
+        segment-write overhead once instead of N times.
+
+        Args:
+            entries: Dicts with "video_url", "analysis_json", and optional
+                "metadata" keys (same semantics as add_video_analysis)
+
+        Returns:
+            List of document IDs
+
+        Raises:
+            ChromaDBError: If storage fails
+        """
+        if not entries:
+            return []
+
+        try:
+            ids: List[str] = []
+            documents: List[str] = []
+            metadatas: List[Dict[str, Any]] = []
+            for entry in entries:
+                doc_id, content, doc_metadata = self._build_entry(
+                    entry["video_url"],
+                    entry["analysis_json"],
+                    entry.get("metadata")
+                )
+                ids.append(doc_id)
+                documents.append(content)
+                metadatas.append(doc_metadata)
+
+            self.collection.add(
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids
+            )
+
+            logger.info(f"Added {len(ids)} video analyses to ChromaDB in one batch")
+            return ids
+
+        except ChromaError as e:
+            error_msg = f"ChromaDB error adding video analyses batch: {str(e)}"
+            logger.error(error_msg)
+            raise ChromaDBError(error_msg) from e
+        except Exception as e:
+            error_msg = f"Unexpected error adding video analyses batch: {str(e)}"
+            logger.error(error_msg)
+            raise ChromaDBError(error_msg) from e
     
     def _get_time_filter(self, target_date: Optional[date] = None) -> Dict[str, Any]:
         """
@@ -136,17 +376,12 @@ class ChromaStore:
             ChromaDB where clause for time filtering
         """
         if target_date is None:
-            # Last 24 hours (rolling window)
-            now = datetime.now()
-            start_time = now - timedelta(hours=24)
-            start_timestamp = start_time.timestamp()
-            end_timestamp = now.timestamp()
+            # Last 24 hours (rolling window); time.time() skips the
+            # datetime allocation + timedelta arithmetic
+            end_timestamp = time.time()
+            start_timestamp = end_timestamp - 86400.0
         else:
-            # Specific date (00:00:00 to 23:59:59)
-            start_datetime = datetime.combine(target_date, datetime.min.time())
-            end_datetime = datetime.combine(target_date, datetime.max.time())
-            start_timestamp = start_datetime.timestamp()
-            end_timestamp = end_datetime.timestamp()
+            start_timestamp, end_timestamp = _date_bounds(target_date)
         
         return {
             "$and": [
@@ -155,12 +390,84 @@ class ChromaStore:
             ]
         }
     
+    def _rerank_top_n(self, n_results: int, document_count: int) -> int:
+        """How many candidates to request from the reranker.
+
+        Overfetches by QWEN_RERANK_OVERFETCH so the score floor can drop
+        some results without under-filling, capped at the document count.
+        """
+        return min(int(n_results * self._rerank_overfetch) + 1, document_count)
+
+    def _prepare_rerank_documents(self, documents_raw: List[str]) -> List[str]:
+        """Trim candidate documents for the reranker, stopping at the doc cap.
+
+        Exits as soon as the cap is reached rather than building the full
+        list and slicing, and only copies a document when it actually has
+        surrounding whitespace or exceeds the length cap.
+        """
+        max_chars = self._rerank_max_chars
+        max_docs = self._rerank_max_docs
+        documents = []
+        for i, doc in enumerate(documents_raw):
+            if doc and (doc[:1].isspace() or doc[-1:].isspace()):
+                doc = doc.strip()
+            if not doc:
+                logger.warning("Clip %d has empty document text", i)
+                continue
+            documents.append(doc if len(doc) <= max_chars else doc[:max_chars] + "...")
+            if len(documents) >= max_docs:
+                break
+        return documents
+
+    @staticmethod
+    def _assemble_clips(
+        rerank_results: List[Dict[str, Any]],
+        metadatas: List[Dict[str, Any]],
+        n_results: int,
+        min_score: float
+    ) -> List[Dict[str, Any]]:
+        """Turn reranker output into clip dicts, applying the score floor."""
+        clips = []
+        metas_len = len(metadatas)
+        # Hard cap: results are sorted by score, so anything past 3x the
+        # requested count can never be kept once the floor applies.
+        for r in rerank_results[: n_results * 3]:
+            idx = r.get("index", 0)
+            score = r.get("relevance_score", 0.0)
+
+            # Filter out low-relevance clips
+            if score < min_score:
+                continue
+
+            if idx >= metas_len:
+                logger.warning("Rerank result index %d out of range (have %d metadatas)", idx, metas_len)
+                continue
+            meta = metadatas[idx]
+            clips.append({
+                "video_url": meta.get("video_url", ""),
+                "metadata": meta,
+                "relevance_score": score,
+                "distance": 1.0 - score,
+            })
+
+            # Stop once we have enough results
+            if len(clips) >= n_results:
+                break
+
+        # One summary line instead of a log call per candidate
+        logger.debug(
+            "Kept %d/%d reranked clips (min_score=%.2f)",
+            len(clips), len(rerank_results), min_score
+        )
+        return clips
+
     def search_clips(
         self,
         query: str,
         n_results: int = 5,
         target_date: Optional[date] = None,
         rerank_client: Optional["QwenVLClient"] = None,
+        min_relevance_score: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search for relevant video clips based on query using Qwen reranker.
@@ -171,6 +478,8 @@ class ChromaStore:
             n_results: Number of results to return
             target_date: Specific date to filter. If None, uses last 24 hours.
             rerank_client: Qwen client with rerank_documents(); required for search.
+            min_relevance_score: Extra relevance floor applied on top of the
+                configured CLIP_MIN_RELEVANCE_SCORE (callers avoid re-filtering).
 
         Returns:
             List of dicts with video_url, metadata, relevance_score (and distance for compat).
@@ -183,8 +492,7 @@ class ChromaStore:
                 logger.warning("search_clips called without rerank_client; returning no results")
                 return []
 
-            settings = get_settings()
-            n_results = max(1, min(int(n_results or settings.DEFAULT_SEARCH_RESULTS), settings.MAX_SEARCH_RESULTS))
+            n_results = max(1, min(int(n_results or self._default_results), self._max_results))
             time_filter = self._get_time_filter(target_date)
 
             # Get all clips in time window (candidate documents)
@@ -204,56 +512,22 @@ class ChromaStore:
             # Log what we found
             logger.info(f"Retrieved {len(ids)} clips from ChromaDB for reranking")
             
-            max_chars = getattr(settings, "QWEN_RERANK_MAX_CHARS_PER_DOC", 16000)
-            max_docs = getattr(settings, "QWEN_RERANK_MAX_DOCS", 500)
-            documents = []
-            for i, doc in enumerate(documents_raw):
-                text = (doc or "").strip()
-                if not text:
-                    logger.warning(f"Clip {i} has empty document text")
-                    continue
-                if len(text) > max_chars:
-                    text = text[:max_chars] + "..."
-                documents.append(text)
-            documents = documents[:max_docs]
-            
+            documents = self._prepare_rerank_documents(documents_raw)
+
             if not documents:
                 logger.warning(f"No valid document texts found for reranking (had {len(documents_raw)} raw docs)")
                 return []
 
             logger.info(f"Sending {len(documents)} documents to Qwen reranker (query: '{query[:50]}...')")
             # Rerank with Qwen (get more candidates than needed, then filter by score)
-            rerank_results = rerank_client.rerank_documents(query, documents, top_n=min(n_results * 2, len(documents)))
+            rerank_results = rerank_client.rerank_documents(query, documents, top_n=self._rerank_top_n(n_results, len(documents)))
             logger.info(f"Reranker returned {len(rerank_results)} results")
-            
-            # Filter by minimum relevance score
-            min_score = getattr(settings, "CLIP_MIN_RELEVANCE_SCORE", 0.3)
-            clips = []
-            for r in rerank_results:
-                idx = r.get("index", 0)
-                score = r.get("relevance_score", 0.0)
-                
-                # Filter out low-relevance clips
-                if score < min_score:
-                    logger.debug(f"Skipping clip {idx}: score {score:.4f} < min {min_score}")
-                    continue
-                
-                if idx >= len(metadatas):
-                    logger.warning(f"Rerank result index {idx} out of range (have {len(metadatas)} metadatas)")
-                    continue
-                meta = metadatas[idx]
-                clip = {
-                    "video_url": meta.get("video_url", ""),
-                    "metadata": meta,
-                    "relevance_score": score,
-                    "distance": 1.0 - score,
-                }
-                clips.append(clip)
-                logger.info(f"Added clip {idx}: score={score:.4f}, url={meta.get('video_url', '')[:50]}...")
-                
-                # Stop once we have enough results
-                if len(clips) >= n_results:
-                    break
+
+            # Filter by minimum relevance score (caller floor combines with config)
+            min_score = self._min_relevance_score
+            if min_relevance_score is not None:
+                min_score = max(min_score, min_relevance_score)
+            clips = self._assemble_clips(rerank_results, metadatas, n_results, min_score)
 
             date_desc = target_date.isoformat() if target_date else "last 24 hours"
             logger.info(f"Found {len(clips)} clips for query '{query[:50]}...' in {date_desc}")
@@ -268,47 +542,161 @@ class ChromaStore:
             logger.error(error_msg)
             raise ChromaDBError(error_msg) from e
     
+    def search_clips_multi(
+        self,
+        queries: List[str],
+        n_results: int = 5,
+        target_date: Optional[date] = None,
+        rerank_client: Optional["QwenVLClient"] = None,
+        min_relevance_score: Optional[float] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search several queries over the same time window in one pass.
+
+        Fetches the candidate window from ChromaDB once and reranks each
+        query concurrently, instead of callers looping search_clips and
+        re-fetching the same documents per query.
+
+        Args:
+            queries: Search query texts
+            n_results: Number of results to return per query
+            target_date: Specific date to filter. If None, uses last 24 hours.
+            rerank_client: Qwen client with rerank_documents(); required for search.
+            min_relevance_score: Extra relevance floor (see search_clips)
+
+        Returns:
+            Dict mapping each query to its clip list (same shape as search_clips)
+        """
+        queries = [q.strip() for q in queries if q and q.strip()]
+        if not queries:
+            return {}
+        if len(queries) == 1:
+            q = queries[0]
+            return {q: self.search_clips(q, n_results, target_date, rerank_client, min_relevance_score)}
+        if rerank_client is None:
+            logger.warning("search_clips_multi called without rerank_client; returning no results")
+            return {q: [] for q in queries}
+
+        try:
+            n_results = max(1, min(int(n_results or self._default_results), self._max_results))
+            time_filter = self._get_time_filter(target_date)
+
+            results = self.collection.get(
+                where=time_filter,
+                include=["metadatas", "documents"],
+            )
+            ids = results.get("ids") or []
+            if not ids:
+                return {q: [] for q in queries}
+
+            metadatas = results.get("metadatas") or []
+            documents_raw = results.get("documents") or []
+
+            documents = self._prepare_rerank_documents(documents_raw)
+            if not documents:
+                return {q: [] for q in queries}
+
+            min_score = self._min_relevance_score
+            if min_relevance_score is not None:
+                min_score = max(min_score, min_relevance_score)
+
+            top_n = self._rerank_top_n(n_results, len(documents))
+            # Rerank calls are network-bound; a small pool overlaps them.
+            with ThreadPoolExecutor(max_workers=min(len(queries), 4)) as pool:
+                reranked = list(pool.map(
+                    lambda q: rerank_client.rerank_documents(q, documents, top_n=top_n),
+                    queries
+                ))
+
+            return {
+                q: self._assemble_clips(rerank_results, metadatas, n_results, min_score)
+                for q, rerank_results in zip(queries, reranked)
+            }
+
+        except ChromaError as e:
+            error_msg = f"ChromaDB error searching clips (multi): {str(e)}"
+            logger.error(error_msg)
+            raise ChromaDBError(error_msg) from e
+        except Exception as e:
+            error_msg = f"Unexpected error searching clips (multi): {str(e)}"
+            logger.error(error_msg)
+            raise ChromaDBError(error_msg) from e
+
     def get_videos_for_analysis(
         self,
         query: str,
         n_results: int = 5,
-        target_date: Optional[date] = None
+        target_date: Optional[date] = None,
+        rerank_client: Optional["QwenVLClient"] = None
     ) -> List[str]:
         """
         Get video URLs for analysis based on query.
-        
+
         Args:
             query: Search query text
             n_results: Number of results to return
             target_date: Specific date to filter. If None, uses last 24 hours.
-        
+            rerank_client: Qwen client with rerank_documents(); required for search.
+
         Returns:
             List of video URLs
         """
-        clips = self.search_clips(query, n_results, target_date)
+        clips = self.search_clips(query, n_results, target_date, rerank_client)
         return [clip["video_url"] for clip in clips]
     
-    def get_all_videos(self) -> List[Dict[str, Any]]:
+    def get_analysis(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the full analysis JSON for a stored entry.
+
+        Args:
+            doc_id: ChromaDB document ID
+
+        Returns:
+            Parsed analysis payload, or None if not found
+        """
+        try:
+            sidecar = self._analyses_dir / f"{doc_id}.json"
+            if sidecar.exists():
+                return orjson.loads(sidecar.read_bytes())
+
+            # Entries written before sidecar storage kept the blob inline
+            results = self.collection.get(ids=[doc_id], include=["metadatas"])
+            metadatas = results.get("metadatas") or []
+            if metadatas and metadatas[0].get("analysis"):
+                return orjson.loads(metadatas[0]["analysis"])
+            return None
+        except (ChromaError, orjson.JSONDecodeError, OSError) as e:
+            logger.error(f"Error loading analysis for {doc_id}: {str(e)}")
+            raise ChromaDBError(f"Failed to load analysis for {doc_id}: {str(e)}") from e
+
+    def get_all_videos(self, include_documents: bool = True) -> List[Dict[str, Any]]:
         """
         Get all stored video entries.
-        
+
+        Args:
+            include_documents: Fetch document texts too. Callers that only
+                need ids/metadata can skip the (potentially large) documents.
+
         Returns:
             List of video entries
         """
         try:
-            results = self.collection.get()
-            
-            videos = []
-            if results["ids"]:
-                for i in range(len(results["ids"])):
-                    video = {
-                        "id": results["ids"][i],
-                        "metadata": results["metadatas"][i] if results["metadatas"] else {},
-                        "document": results["documents"][i] if results["documents"] else ""
-                    }
-                    videos.append(video)
-            
-            return videos
+            # Explicit projection: the default include can ship embeddings
+            # (1024 floats per entry) that this method never returns.
+            include = ["metadatas", "documents"] if include_documents else ["metadatas"]
+            results = self.collection.get(include=include)
+
+            ids = results["ids"]
+            if not ids:
+                return []
+            # Hoist the column lists once and zip instead of re-indexing
+            # the results dict three times per entry.
+            metadatas = results["metadatas"] or ({},) * len(ids)
+            documents = results["documents"] or ("",) * len(ids)
+            return [
+                {"id": doc_id, "metadata": meta, "document": doc}
+                for doc_id, meta, doc in zip(ids, metadatas, documents)
+            ]
         except Exception as e:
             logger.error(f"Error getting all videos: {str(e)}")
             raise ChromaDBError(f"Failed to get all videos: {str(e)}") from e
@@ -324,16 +712,41 @@ class ChromaStore:
             ChromaDBError: If retrieval fails
         """
         try:
-            results = self.collection.get()
-            
-            dates_set = set()
-            if results["ids"] and results["metadatas"]:
-                for metadata in results["metadatas"]:
+            key = (self.persist_directory, self.collection_name)
+            count = self.collection.count()
+            with _dates_lock:
+                cached = _dates_cache.get(key)
+            # Dates only change when rows are added, so an unchanged count
+            # means the cached answer is still exact.
+            if cached and cached["count"] == count:
+                return cached["sorted"]
+
+            if cached and count > cached["count"] and cached["max_ts"] > 0:
+                # Rows only grew: fetch just the ones newer than the cached
+                # high-water mark instead of rescanning the collection.
+                # (Every writer stamps timestamp_unix, so the filter is
+                # complete; shrinking counts fall through to a full scan.)
+                results = self.collection.get(
+                    where={"timestamp_unix": {"$gt": cached["max_ts"]}},
+                    include=["metadatas"]
+                )
+                metadatas = results.get("metadatas") or []
+                timestamps = [
+                    m["timestamp_unix"] for m in metadatas if "timestamp_unix" in m
+                ]
+                dates_set = cached["dates"] | _unique_dates(timestamps)
+                max_ts = max(timestamps, default=cached["max_ts"])
+            else:
+                # Metadata-only projection: documents can be multi-KB
+                # analysis texts and are never used here.
+                results = self.collection.get(include=["metadatas"])
+
+                dates_set = set()
+                timestamps = []
+                for metadata in results.get("metadatas") or []:
                     # Try to get timestamp from metadata
                     if "timestamp_unix" in metadata:
-                        # Convert unix timestamp to date
-                        dt = datetime.fromtimestamp(metadata["timestamp_unix"])
-                        dates_set.add(dt.date().isoformat())
+                        timestamps.append(metadata["timestamp_unix"])
                     elif "timestamp" in metadata:
                         # Fallback: parse ISO timestamp
                         try:
@@ -341,12 +754,24 @@ class ChromaStore:
                             dates_set.add(dt.date().isoformat())
                         except (ValueError, TypeError):
                             pass
-            
+                # Unix timestamps convert in bulk (unique minute buckets)
+                # instead of one datetime allocation per row
+                dates_set |= _unique_dates(timestamps)
+                max_ts = max(timestamps, default=0.0)
+
             # Sort dates descending (newest first)
             sorted_dates = sorted(dates_set, reverse=True)
+            with _dates_lock:
+                _dates_cache[key] = {
+                    "count": count,
+                    "max_ts": max_ts,
+                    "dates": dates_set,
+                    "sorted": sorted_dates,
+                }
             logger.info(f"Found {len(sorted_dates)} available dates")
             return sorted_dates
-            
+
+
         except ChromaError as e:
             error_msg = f"ChromaDB error getting available dates: {str(e)}"
             logger.error(error_msg)
@@ -356,6 +781,63 @@ class ChromaStore:
             logger.error(error_msg)
             raise ChromaDBError(error_msg) from e
     
+    def get_dashboard_snapshot(self) -> Dict[str, Any]:
+        """
+        Get processing stats and available dates from one metadata scan.
+
+        The dashboard polls both endpoints together; serving them from a
+        single collection.get() (cached for a short TTL) costs one scan
+        per TTL window instead of two per poll.
+
+        Returns:
+            Dictionary with:
+                - stats: same payload as get_processing_stats
+                - dates: same payload as get_available_dates
+        """
+        key = (self.persist_directory, self.collection_name)
+        now = time.monotonic()
+        with _snapshot_lock:
+            entry = _snapshot_cache.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+
+        try:
+            results = self.collection.get(include=["metadatas"])
+            metadatas = results.get("metadatas") or []
+
+            cutoff = time.time() - 86400.0
+            timestamps = [
+                ts for metadata in metadatas
+                if (ts := metadata.get("timestamp_unix")) is not None
+            ]
+            chunks_processed = sum(1 for ts in timestamps if ts >= cutoff)
+            dates_set = _unique_dates(timestamps)
+
+            total_minutes = chunks_processed * 10
+            max_minutes = 1440
+            snapshot = {
+                "stats": {
+                    "chunks_processed": chunks_processed,
+                    "total_minutes": total_minutes,
+                    "max_minutes": max_minutes,
+                    "progress_percent": round(min((total_minutes / max_minutes) * 100, 100), 1)
+                },
+                "dates": sorted(dates_set, reverse=True)
+            }
+
+            with _snapshot_lock:
+                _snapshot_cache[key] = (now + self._SNAPSHOT_TTL_SECONDS, snapshot)
+            return snapshot
+
+        except ChromaError as e:
+            error_msg = f"ChromaDB error getting dashboard snapshot: {str(e)}"
+            logger.error(error_msg)
+            raise ChromaDBError(error_msg) from e
+        except Exception as e:
+            error_msg = f"Unexpected error getting dashboard snapshot: {str(e)}"
+            logger.error(error_msg)
+            raise ChromaDBError(error_msg) from e
+
     def get_processing_stats(self) -> Dict[str, Any]:
         """
         Get processing statistics for the last 24 hours.
@@ -371,15 +853,16 @@ class ChromaStore:
             ChromaDBError: If retrieval fails
         """
         try:
-            # Get entries from the last 24 hours
-            now = datetime.now()
-            start_time = now - timedelta(hours=24)
-            start_timestamp = start_time.timestamp()
-            
+            # Get entries from the last 24 hours; only the count matters,
+            # so project nothing (include=[] still returns ids) instead of
+            # materializing every metadata dict in the window.
+            start_timestamp = time.time() - 86400.0
+
             results = self.collection.get(
-                where={"timestamp_unix": {"$gte": start_timestamp}}
+                where={"timestamp_unix": {"$gte": start_timestamp}},
+                include=[]
             )
-            
+
             chunks_processed = len(results["ids"]) if results["ids"] else 0
             
             # Each chunk is 10 minutes
@@ -416,14 +899,28 @@ class ChromaStore:
             ChromaDBError: If clearing fails
         """
         try:
-            # Get all IDs in the collection
-            results = self.collection.get()
-            if results["ids"] and len(results["ids"]) > 0:
-                # Delete all entries
-                self.collection.delete(ids=results["ids"])
-                logger.info(f"Cleared {len(results['ids'])} entries from ChromaDB")
-            else:
+            total = self.collection.count()
+            if not total:
                 logger.info("ChromaDB collection is already empty")
+                return
+
+            # Delete in id batches rather than one get() of every document
+            # followed by one mega-delete: peak memory stays bounded and
+            # each delete is its own SQLite transaction.
+            while True:
+                batch = self.collection.get(limit=self._CLEAR_BATCH_SIZE, include=[])["ids"]
+                if not batch:
+                    break
+                self.collection.delete(ids=batch)
+                for doc_id in batch:
+                    (self._analyses_dir / f"{doc_id}.json").unlink(missing_ok=True)
+
+            key = (self.persist_directory, self.collection_name)
+            with _dates_lock:
+                _dates_cache.pop(key, None)
+            with _snapshot_lock:
+                _snapshot_cache.pop(key, None)
+            logger.info(f"Cleared {total} entries from ChromaDB")
         except ChromaError as e:
             error_msg = f"ChromaDB error clearing collection: {str(e)}"
             logger.error(error_msg)
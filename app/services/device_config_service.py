@@ -4,10 +4,11 @@ Stores per-device settings (camera, R2, SMTP, Cloudflare, video_preprompt, etc.)
 separately from the static .env file. These are user-editable at registration
 and from the Settings page.
 """
-import json
 import logging
 import sqlite3
 import threading
+
+import orjson
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from app.core.config import get_settings
@@ -112,7 +113,7 @@ def normalize_multi_cameras(raw_value: Any) -> list[Dict[str, Any]]:
     parsed: list[Dict[str, Any]] = []
     if isinstance(raw_value, str):
         try:
-            decoded = json.loads(raw_value or "[]")
+            decoded = orjson.loads(raw_value or "[]")
             if isinstance(decoded, list):
                 parsed = decoded
         except Exception:
@@ -191,7 +192,7 @@ def upsert_device_config(data: Dict[str, Any]) -> Dict[str, Any]:
         mode = str(data.get("camera_mode") or "single").strip().lower()
         data["camera_mode"] = mode if mode in {"single", "multi"} else "single"
     if "multi_cameras_json" in data:
-        data["multi_cameras_json"] = json.dumps(normalize_multi_cameras(data["multi_cameras_json"]))
+        data["multi_cameras_json"] = orjson.dumps(normalize_multi_cameras(data["multi_cameras_json"])).decode()
     if "setup_deferred" in data:
         data["setup_deferred"] = 1 if bool(data["setup_deferred"]) else 0
     if "setup_completed" in data:
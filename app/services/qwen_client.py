@@ -1,9 +1,11 @@
 """Qwen 3 VL API client service."""
 import logging
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import RequestException
 
 from app.utils.exceptions import QwenAPIError
@@ -44,6 +46,17 @@ def _format_http_error_response(response: requests.Response) -> str:
     return f"status_code={response.status_code} content_type={content_type!r} body={body}"
 
 
+@lru_cache(maxsize=32)
+def _alert_response_pattern(alert_ids: Tuple[str, ...]) -> "re.Pattern[str]":
+    """One combined pattern matching any "ALERT_ID: TRUE/FALSE" line.
+
+    Compiled once per alert-id set (the set is stable between alert config
+    changes), replacing a per-line, per-alert re.search loop.
+    """
+    ids = "|".join(re.escape(alert_id) for alert_id in alert_ids)
+    return re.compile(rf"({ids})\s*:\s*(TRUE|FALSE)", re.IGNORECASE)
+
+
 class QwenVLClient:
     """Client for Qwen 3 VL Plus and Qwen 3 VL Flash APIs."""
     
@@ -65,6 +78,21 @@ class QwenVLClient:
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
+        # One keep-alive connection pool for all embed/rerank/VL calls;
+        # module-level requests.post would pay TCP + TLS setup per request.
+        # Transport-level retries cover throttles and gateway blips (POST
+        # must be allowed explicitly); application errors still surface as
+        # QwenAPIError after the retry budget.
+        self._session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["POST"],
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         logger.info("QwenVLClient initialized")
 
     def get_embeddings(self, texts: List[str]) -> List[List[float]]:
@@ -85,7 +113,7 @@ class QwenVLClient:
                 "encoding_format": "float",
             }
             try:
-                response = requests.post(
+                response = self._session.post(
                     f"{self.base_url}/embeddings",
                     headers=self.headers,
                     json=payload,
@@ -148,7 +176,7 @@ class QwenVLClient:
             }
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=self.headers,
                 json=payload,
@@ -237,7 +265,7 @@ class QwenVLClient:
         
         try:
             logger.info(f"Processing video with Qwen 3 VL Plus: {video_url}")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json=payload,
@@ -311,7 +339,7 @@ class QwenVLClient:
         
         try:
             logger.info(f"Analyzing video with Qwen 3 VL Flash: {video_url}")
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json=payload,
@@ -357,24 +385,24 @@ class QwenVLClient:
             Dictionary mapping alert_id to boolean (True if alert triggered)
         """
         results = {alert_id: False for alert_id in alert_ids}
-        
-        # Look for patterns like "ALERT_ID: TRUE" or "ALERT_ID: FALSE" at the end of response
-        lines = response_text.strip().split('\n')
-        
-        # Check last few lines for alert responses
-        for line in reversed(lines[-10:]):  # Check last 10 lines
-            line = line.strip()
-            if not line:
+        if not alert_ids:
+            return results
+
+        # Look for patterns like "ALERT_ID: TRUE" or "ALERT_ID: FALSE" at the
+        # end of the response; one combined regex scans the last 10 lines in
+        # a single pass instead of one re.search per alert per line.
+        tail = "\n".join(response_text.strip().split('\n')[-10:])
+        id_by_lower = {alert_id.lower(): alert_id for alert_id in alert_ids}
+
+        seen = set()
+        for match in _alert_response_pattern(tuple(alert_ids)).finditer(tail):
+            alert_id = id_by_lower[match.group(1).lower()]
+            # First (topmost) occurrence wins, matching the old reversed scan
+            if alert_id in seen:
                 continue
-            
-            # Try to match "ALERT_ID: TRUE/FALSE" pattern
-            for alert_id in alert_ids:
-                # Pattern: alert_id followed by colon and TRUE/FALSE
-                pattern = rf"{re.escape(alert_id)}\s*:\s*(TRUE|FALSE)"
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    value = match.group(1).upper()
-                    results[alert_id] = (value == "TRUE")
-                    logger.debug(f"Parsed alert {alert_id}: {value}")
-        
+            seen.add(alert_id)
+            value = match.group(2).upper()
+            results[alert_id] = (value == "TRUE")
+            logger.debug("Parsed alert %s: %s", alert_id, value)
+
         return results
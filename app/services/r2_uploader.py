@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -51,7 +52,22 @@ class R2Uploader:
                 endpoint_url=f'https://{self.account_id}.r2.cloudflarestorage.com',
                 aws_access_key_id=access_key_id or settings.R2_ACCESS_KEY_ID,
                 aws_secret_access_key=secret_access_key or settings.R2_SECRET_ACCESS_KEY,
-                config=Config(signature_version='s3v4')
+                # The client (and its connection pool) lives for the whole
+                # process, so size the pool for concurrent chunk uploads and
+                # let botocore absorb transient throttling adaptively.
+                config=Config(
+                    signature_version='s3v4',
+                    max_pool_connections=32,
+                    retries={'max_attempts': 3, 'mode': 'adaptive'}
+                )
+            )
+            # upload_file streams multipart from disk; the explicit config
+            # pins per-upload memory to multipart_chunksize x max_concurrency
+            # (32 MiB) no matter how large an hour-long footage file gets.
+            self._transfer_config = TransferConfig(
+                multipart_chunksize=8 * 1024 * 1024,
+                max_concurrency=4,
+                use_threads=True
             )
             logger.info("R2Uploader initialized successfully")
         except Exception as e:
@@ -85,7 +101,8 @@ class R2Uploader:
                 file_path,
                 self.bucket_name,
                 object_key,
-                ExtraArgs={'ContentType': self._get_content_type(file_path)}
+                ExtraArgs={'ContentType': self._get_content_type(file_path)},
+                Config=self._transfer_config
             )
             
             public_url = f"{self.public_url_base}/{object_key}"
@@ -0,0 +1,25 @@
+import unittest
+
+from app.api.routes.alerts import router
+
+
+class AlertRouteOrderTests(unittest.TestCase):
+    def test_history_route_registered_before_alert_id(self):
+        # Starlette matches routes in declaration order, so the literal
+        # /alerts/history must stay ahead of /alerts/{alert_id} or it would be
+        # swallowed by the parameterized route (404 after a wasted DB lookup).
+        get_paths = [
+            route.path
+            for route in router.routes
+            if "GET" in (getattr(route, "methods", None) or ())
+        ]
+        self.assertIn("/alerts/history", get_paths)
+        self.assertIn("/alerts/{alert_id}", get_paths)
+        self.assertLess(
+            get_paths.index("/alerts/history"),
+            get_paths.index("/alerts/{alert_id}"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+"""orjson-backed JSON helpers."""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# orjson serializes datetime/date/UUID natively in Rust, so no Python-level
+# default= callback is needed; options are precomputed once at import.
+ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes with the shared orjson options."""
+    return orjson.dumps(obj, option=ORJSON_OPTS)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (much faster than stdlib json)."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -26,8 +26,9 @@ TARGETS = {
     # Raw footage + thumbnails cache inside it
     "footage/": ROOT / "footage",
 
-    # Alert rules & history
+    # Alert rules & history (.json is the legacy pre-JSONL history file)
     "alerts.json": ROOT / "alerts.json",
+    "alert_history.jsonl": ROOT / "alert_history.jsonl",
     "alert_history.json": ROOT / "alert_history.json",
 
     # Application logs